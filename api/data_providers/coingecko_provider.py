@@ -3,11 +3,48 @@ CoinGecko API Provider
 Provides real cryptocurrency prices from CoinGecko (free tier)
 """
 
+import json
+import logging
 import requests
-import time
 from typing import Optional, Dict
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import Config
+from utils.rate_limiter import RateLimiter
+
+try:
+    # Optional: several times faster than json on large /simple/price payloads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all CoinGecko requests.
+
+    Keeps TCP/TLS connections alive between calls and retries transient
+    server errors. 429 responses are handled by the provider itself.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"})
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# Module-level singletons so every provider instance shares one connection pool
+# and one request budget (free tier: one request per 1.5 s)
+_session = _create_session()
+_rate_limiter = RateLimiter(rate=1 / 1.5, burst=1)
 
 
 class CoinGeckoProvider:
@@ -62,6 +99,15 @@ class CoinGeckoProvider:
         self.base_url = "https://api.coingecko.com/api/v3"
         self.timeout = 10  # seconds
         self.rate_limit_delay = 1.5  # seconds between requests to avoid 429 errors
+        self.session = _session
+        self.rate_limiter = _rate_limiter
+
+    def _retry_after(self, response) -> float:
+        """Seconds to hold back after a 429 response (Retry-After header or default backoff)"""
+        try:
+            return float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            return self.rate_limit_delay * 2
 
     def get_token_price(self, token_symbol: str) -> Optional[Dict]:
         """
@@ -76,7 +122,7 @@ class CoinGeckoProvider:
         # Get CoinGecko ID
         coin_id = self.SYMBOL_TO_ID.get(token_symbol)
         if not coin_id:
-            print(f"Warning: No CoinGecko ID mapping for {token_symbol}")
+            logger.warning("No CoinGecko ID mapping for %s", token_symbol)
             return None
 
         # API endpoint
@@ -91,15 +137,18 @@ class CoinGeckoProvider:
             "include_market_cap": "true"
         }
 
+        # Wait for the shared request budget instead of sleeping after each call
+        self.rate_limiter.acquire()
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 endpoint,
                 params=params,
                 timeout=self.timeout
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
 
                 if coin_id in data:
                     coin_data = data[coin_id]
@@ -114,19 +163,17 @@ class CoinGeckoProvider:
                     }
 
             elif response.status_code == 429:
-                print(f"CoinGecko rate limit exceeded. Waiting {self.rate_limit_delay * 2}s...")
-                time.sleep(self.rate_limit_delay * 2)
+                delay = self._retry_after(response)
+                logger.warning("CoinGecko rate limit exceeded. Waiting %ss...", delay)
+                self.rate_limiter.defer(delay)
                 return None
             else:
-                print(f"CoinGecko API error: {response.status_code}")
+                logger.error("CoinGecko API error: %s", response.status_code)
                 return None
 
         except Exception as e:
-            print(f"Error fetching price from CoinGecko: {str(e)}")
+            logger.error("Error fetching price from CoinGecko: %s", e)
             return None
-        finally:
-            # Add delay to avoid rate limiting
-            time.sleep(self.rate_limit_delay)
 
     def get_multiple_prices(self, token_symbols: list) -> Dict[str, Optional[Dict]]:
         """
@@ -163,15 +210,18 @@ class CoinGeckoProvider:
             "include_market_cap": "true"
         }
 
+        # Wait for the shared request budget instead of sleeping after each call
+        self.rate_limiter.acquire()
+
         try:
-            response = requests.get(
+            response = self.session.get(
                 endpoint,
                 params=params,
                 timeout=self.timeout * 2  # More time for bulk request
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 result = {}
 
                 for coin_id, coin_data in data.items():
@@ -185,19 +235,19 @@ class CoinGeckoProvider:
                         "source": "coingecko"
                     }
 
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Fetched %d of %d CoinGecko prices", len(result), len(coin_ids))
                 return result
 
             elif response.status_code == 429:
-                print(f"CoinGecko rate limit exceeded. Waiting {self.rate_limit_delay * 2}s...")
-                time.sleep(self.rate_limit_delay * 2)
+                delay = self._retry_after(response)
+                logger.warning("CoinGecko rate limit exceeded. Waiting %ss...", delay)
+                self.rate_limiter.defer(delay)
                 return {}
             else:
-                print(f"CoinGecko API error: {response.status_code}")
+                logger.error("CoinGecko API error: %s", response.status_code)
                 return {}
 
         except Exception as e:
-            print(f"Error fetching prices from CoinGecko: {str(e)}")
+            logger.error("Error fetching prices from CoinGecko: %s", e)
             return {}
-        finally:
-            # Add delay to avoid rate limiting
-            time.sleep(self.rate_limit_delay)
@@ -22,6 +22,9 @@ class Config:
         }
     }
 
+    # DEX keys in display/column order
+    DEX_KEYS = tuple(DEX_CONFIG.keys())
+
     # 40 Most Popular Tokens Configuration
     TOKENS_CONFIG = [
         {"symbol": "WBTC", "name": "Wrapped Bitcoin", "decimals": 8},
@@ -87,3 +90,5 @@ class Config:
 
     # Cache Configuration
     PRICE_CACHE_TTL = 30  # seconds - CoinGecko API cache duration
+    NEGATIVE_CACHE_TTL = 60  # seconds - skip symbols CoinGecko did not return
+    DEX_VARIANT_CACHE_TTL = 300  # seconds - reuse simulated DEX prices while the base price is unchanged
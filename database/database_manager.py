@@ -219,6 +219,17 @@ class DatabaseManager:
         rows = self.cursor.fetchall()
         return [(Token(*row[:9]), TrackedToken(*row[9:])) for row in rows]
 
+    def is_tracked(self, token_id: int) -> bool:
+        """Check if a token is tracked (uses the UNIQUE index on token_id)"""
+        self.cursor.execute('''
+            SELECT 1
+            FROM tracked_tokens tt
+            INNER JOIN tokens t ON t.id = tt.token_id
+            WHERE tt.token_id = ? AND t.is_tracked = 1
+            LIMIT 1
+        ''', (token_id,))
+        return self.cursor.fetchone() is not None
+
     def get_available_tokens(self) -> List[Token]:
         """Get tokens that are not tracked"""
         self.cursor.execute('''
@@ -330,6 +341,28 @@ class DatabaseManager:
         self.conn.commit()
         return self.cursor.lastrowid
 
+    def insert_arbitrage_opportunities_bulk(self, rows: List[Tuple],
+                                            timestamp: Optional[datetime] = None) -> int:
+        """Insert many arbitrage opportunities in a single transaction.
+
+        Each row is (token_id, buy_dex, buy_price, sell_dex, sell_price,
+        profit_percent, profit_dollar). All rows share one timestamp, so the
+        batch is returned together by get_latest_arbitrage_opportunities.
+        """
+        if not rows:
+            return 0
+
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        self.cursor.executemany('''
+            INSERT INTO arbitrage_opportunities
+            (token_id, buy_dex, buy_price, sell_dex, sell_price, profit_percent, profit_dollar, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [(*row, timestamp) for row in rows])
+        self.conn.commit()
+        return self.cursor.rowcount
+
     def get_latest_arbitrage_opportunities(self) -> List[Tuple]:
         """Get the most recent arbitrage opportunities with token info"""
         self.cursor.execute('''
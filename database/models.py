@@ -68,7 +68,7 @@ class OHLCVData:
         return f"OHLCV(token_id={self.token_id}, dex={self.dex}, tf={self.timeframe}, close=${self.close_price:.4f})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """Arbitrage opportunity data"""
     id: Optional[int]
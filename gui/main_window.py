@@ -9,6 +9,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QAction, QKeySequence
 
+from config import Config
 from database.database_manager import DatabaseManager
 from services.token_manager import TokenManager
 from services.data_service import DataService
@@ -17,6 +18,7 @@ from gui.widgets.available_tokens_table import AvailableTokensTable
 from gui.widgets.tracked_tokens_table import TrackedTokensTable
 from gui.widgets.current_prices_table import CurrentPricesTable
 from gui.widgets.arbitrage_table import ArbitrageTable
+from gui.threads.price_fetcher import PriceFetcherThread
 
 
 class MainWindow(QMainWindow):
@@ -24,14 +26,27 @@ class MainWindow(QMainWindow):
     Main application window with tabs for different views.
     """
 
-    def __init__(self):
+    def __init__(self, db_manager=None):
+        """
+        Initialize main window.
+
+        Args:
+            db_manager: DatabaseManager to use (optional); a new one is opened and
+                owned by the window if omitted
+        """
         super().__init__()
 
         # Initialize backend services
-        self.db_manager = DatabaseManager()
+        self._owns_db = db_manager is None
+        self.db_manager = db_manager or DatabaseManager()
         self.token_manager = TokenManager(self.db_manager)
         self.data_service = DataService()
 
+        # Background thread for toolbar refreshes
+        self.refresh_thread = None
+        self._refresh_tracked = []
+        self._refresh_count = 0
+
         # Initialize theme manager
         self.theme_manager = ThemeManager(self.app_instance, self.db_manager)
 
@@ -209,6 +224,10 @@ class MainWindow(QMainWindow):
         Handle refresh action - refreshes prices on all 3 tabs with 1 API call.
         Updates: Available Tokens, Tracked Tokens, and Current Prices tabs.
         """
+        if self.refresh_thread and self.refresh_thread.isRunning():
+            self.set_status("Refresh already in progress...")
+            return
+
         self.set_status("Refreshing prices...")
 
         # Get all tokens (both available and tracked)
@@ -223,14 +242,24 @@ class MainWindow(QMainWindow):
             self.set_status("No tokens to refresh")
             return
 
-        # Extract symbols
-        token_symbols = [t.symbol for t in all_tokens]
-        dex_keys = ["uniswap_v3", "pancakeswap_v3", "sushiswap", "curve"]
+        # Bulk fetch all prices (1 API CALL!) off the GUI thread
+        self._refresh_tracked = tracked_tokens_data
+        self._refresh_count = len(all_tokens)
 
-        # Bulk fetch all prices (1 API CALL!)
-        try:
-            all_prices = self.data_service.get_bulk_prices_all_dexes(token_symbols, dex_keys)
+        self.refresh_thread = PriceFetcherThread(all_tokens, self.data_service, Config.DEX_KEYS)
+        self.refresh_thread.prices_fetched.connect(self.on_prices_refreshed)
+        self.refresh_thread.error.connect(self.on_refresh_error)
+        self.refresh_thread.start()
 
+    @Slot(dict)
+    def on_prices_refreshed(self, all_prices):
+        """
+        Apply bulk fetched prices to all 3 tabs.
+
+        Args:
+            all_prices: Dict of {symbol: {dex_key: price_data}}
+        """
+        try:
             # Update Available Tokens table
             if hasattr(self, 'available_tokens_table'):
                 self.update_available_tokens_prices(all_prices)
@@ -241,13 +270,23 @@ class MainWindow(QMainWindow):
 
             # Update Current Prices table
             if hasattr(self, 'current_prices_table'):
-                self.update_current_prices_table(all_prices)
+                self.update_current_prices_table(all_prices, self._refresh_tracked)
 
-            self.set_status(f"Refreshed prices for {len(all_tokens)} tokens")
+            self.set_status(f"Refreshed prices for {self._refresh_count} tokens")
 
         except Exception as e:
             self.set_status(f"Error refreshing prices: {str(e)}")
 
+    @Slot(str)
+    def on_refresh_error(self, error_msg):
+        """
+        Handle refresh thread error.
+
+        Args:
+            error_msg: Error message
+        """
+        self.set_status(f"Error refreshing prices: {error_msg}")
+
     def update_available_tokens_prices(self, all_prices):
         """
         Update prices in Available Tokens table.
@@ -255,9 +294,10 @@ class MainWindow(QMainWindow):
         Args:
             all_prices: Dict of {symbol: {dex_key: price_data}}
         """
-        from utils import format_price
+        from utils import format_prices
 
         table = self.available_tokens_table.table
+        updates = []  # (row, avg_price, total_volume, avg_liquidity)
 
         for row in range(table.rowCount()):
             symbol_item = table.item(row, 1)  # Symbol column
@@ -270,16 +310,21 @@ class MainWindow(QMainWindow):
 
             # Get average price across all DEXes
             dex_prices = all_prices[symbol]
-            prices = [data.get('price_usd', 0) for data in dex_prices.values() if data.get('price_usd', 0) > 0]
-            volumes = [data.get('volume_24h', 0) for data in dex_prices.values() if data.get('volume_24h', 0) > 0]
-            liquidities = [data.get('liquidity_usd', 0) for data in dex_prices.values() if data.get('liquidity_usd', 0) > 0]
+            prices = [data.price_usd for data in dex_prices.values() if data.price_usd > 0]
+            volumes = [data.volume_24h for data in dex_prices.values() if data.volume_24h > 0]
+            liquidities = [data.liquidity_usd for data in dex_prices.values() if data.liquidity_usd > 0]
 
             avg_price = sum(prices) / len(prices) if prices else 0
             total_volume = sum(volumes) if volumes else 0
             avg_liquidity = sum(liquidities) / len(liquidities) if liquidities else 0
 
+            updates.append((row, avg_price, total_volume, avg_liquidity))
+
+        # Format the whole Price column in one call
+        price_texts = format_prices([avg_price for _, avg_price, _, _ in updates])
+
+        for (row, _, total_volume, avg_liquidity), price_text in zip(updates, price_texts):
             # Update Price column (index 3)
-            price_text = format_price(avg_price) if avg_price > 0 else "$0.00"
             price_item = table.item(row, 3)
             if price_item:
                 price_item.setText(price_text)
@@ -303,53 +348,46 @@ class MainWindow(QMainWindow):
         Args:
             all_prices: Dict of {symbol: {dex_key: price_data}}
         """
-        from utils import format_price
+        from utils import format_prices
 
-        table = self.tracked_tokens_table.table
-
-        for row in range(table.rowCount()):
-            symbol_item = table.item(row, 0)  # Symbol column
-            if not symbol_item:
-                continue
-
-            symbol = symbol_item.text()
-            if symbol not in all_prices:
-                continue
+        rows = []  # (symbol, volatility, liquidity_text)
+        avg_prices = []
 
+        for symbol, dex_prices in all_prices.items():
             # Get data from all DEXes
-            dex_prices = all_prices[symbol]
-            prices = [data.get('price_usd', 0) for data in dex_prices.values() if data.get('price_usd', 0) > 0]
-            price_changes = [data.get('price_change_24h', 0) for data in dex_prices.values()]
-            liquidities = [data.get('liquidity_usd', 0) for data in dex_prices.values() if data.get('liquidity_usd', 0) > 0]
+            prices = [data.price_usd for data in dex_prices.values() if data.price_usd > 0]
+            price_changes = [data.price_change_24h for data in dex_prices.values()]
+            liquidities = [data.liquidity_usd for data in dex_prices.values() if data.liquidity_usd > 0]
 
             avg_price = sum(prices) / len(prices) if prices else 0
             avg_change = sum(price_changes) / len(price_changes) if price_changes else 0
             avg_liquidity = sum(liquidities) / len(liquidities) if liquidities else 0
 
-            # Update Price column (index 2)
-            price_text = format_price(avg_price) if avg_price > 0 else "$0.00"
-            price_item = table.item(row, 2)
-            if price_item:
-                price_item.setText(price_text)
+            avg_prices.append(avg_price)
 
-            # Update Volatility column (index 3) based on 24h change
+            # Volatility column based on 24h change
             volatility = "High" if abs(avg_change) > 5 else "Medium" if abs(avg_change) > 2 else "Low"
-            volatility_item = table.item(row, 3)
-            if volatility_item:
-                volatility_item.setText(volatility)
 
-            # Update Liquidity column (index 4)
+            # Liquidity column
             liquidity_text = f"${avg_liquidity:,.0f}" if avg_liquidity > 0 else "$0"
-            liquidity_item = table.item(row, 4)
-            if liquidity_item:
-                liquidity_item.setText(liquidity_text)
 
-    def update_current_prices_table(self, all_prices):
+            rows.append((symbol, volatility, liquidity_text))
+
+        # Price column, formatted for all tokens in one call
+        market = {
+            symbol: (price_text, volatility, liquidity_text)
+            for (symbol, volatility, liquidity_text), price_text in zip(rows, format_prices(avg_prices))
+        }
+
+        self.tracked_tokens_table.update_market_data(market)
+
+    def update_current_prices_table(self, all_prices, tracked_tokens=None):
         """
         Update the Current Prices table with bulk fetched data.
 
         Args:
             all_prices: Dict of {symbol: {dex_key: price_data}}
+            tracked_tokens: List of (Token, TrackedToken) tuples (optional)
         """
         # Clear and populate the prices cache
         self.current_prices_table.prices_cache.clear()
@@ -358,10 +396,10 @@ class MainWindow(QMainWindow):
             self.current_prices_table.prices_cache[symbol] = {}
             for dex_key, price_data in dex_prices.items():
                 if price_data:
-                    self.current_prices_table.prices_cache[symbol][dex_key] = price_data.get('price_usd', 0.0)
+                    self.current_prices_table.prices_cache[symbol][dex_key] = price_data.price_usd
 
         # Update the table display
-        self.current_prices_table.update_table()
+        self.current_prices_table.update_table(tracked_tokens)
 
     @Slot()
     def on_scan(self):
@@ -393,6 +431,10 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'tracked_tokens_table'):
             self.tracked_tokens_table.refresh()
 
+        # Tracked set changed - drop the cached list in Current Prices
+        if hasattr(self, 'current_prices_table'):
+            self.current_prices_table.invalidate_tracked()
+
     @Slot(int, float, str)
     def on_threshold_updated(self, token_id, value, mode):
         """
@@ -420,6 +462,10 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'available_tokens_table'):
             self.available_tokens_table.refresh()
 
+        # Tracked set changed - drop the cached list in Current Prices
+        if hasattr(self, 'current_prices_table'):
+            self.current_prices_table.invalidate_tracked()
+
     def set_status(self, message: str):
         """
         Set status message in both top bar and status bar.
@@ -486,8 +532,13 @@ class MainWindow(QMainWindow):
         # Save window state before closing
         self.save_window_state()
 
-        # Clean up database connection
-        if hasattr(self, 'db_manager'):
+        # Let a running refresh finish before the database goes away
+        if self.refresh_thread and self.refresh_thread.isRunning():
+            self.refresh_thread.requestInterruption()
+            self.refresh_thread.wait()
+
+        # Clean up database connection (a shared one is closed by its owner)
+        if hasattr(self, 'db_manager') and self._owns_db:
             self.db_manager.close()
 
         event.accept()
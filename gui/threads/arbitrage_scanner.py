@@ -3,7 +3,9 @@ Arbitrage Scanner Thread for DEX Analyzer.
 Background thread for detecting arbitrage opportunities.
 """
 
+import numpy as np
 from PySide6.QtCore import QThread, Signal
+from config import Config
 
 
 class ArbitrageScannerThread(QThread):
@@ -28,7 +30,10 @@ class ArbitrageScannerThread(QThread):
         super().__init__()
         self.tracked_tokens = tracked_tokens
         self.data_service = data_service
-        self.dex_keys = ["uniswap_v3", "pancakeswap_v3", "sushiswap", "curve"]
+        self.dex_keys = Config.DEX_KEYS
+
+        # Every (buy, sell) DEX column pair with buy before sell in dex_keys order
+        self._buy_cols, self._sell_cols = np.triu_indices(len(self.dex_keys), k=1)
 
     def run(self):
         """
@@ -53,28 +58,17 @@ class ArbitrageScannerThread(QThread):
                 self.dex_keys
             )
 
-            # Step 3: Analyze each token for arbitrage opportunities
-            for i, (token, tracked) in enumerate(self.tracked_tokens):
+            # Step 3: Analyze all tokens for arbitrage opportunities at once
+            prices = self.build_price_matrix(token_symbols, all_prices)
+            per_token = self.find_opportunities(prices)
+
+            for i, opps in enumerate(per_token):
                 if self.isInterruptionRequested():
                     return
 
-                # Get prices for this token
-                symbol = token.symbol
-                if symbol in all_prices:
-                    # Extract price_usd from each DEX
-                    prices = {}
-                    for dex_key in self.dex_keys:
-                        if dex_key in all_prices[symbol]:
-                            price_data = all_prices[symbol][dex_key]
-                            if price_data and price_data.get('price_usd'):
-                                prices[dex_key] = price_data['price_usd']
-
-                    # Find best buy/sell opportunities
-                    if len(prices) >= 2:
-                        opps = self.find_opportunities(token, tracked, prices)
-                        opportunities_found += len(opps)
-                        for opp in opps:
-                            self.opportunity_found.emit(opp)
+                opportunities_found += len(opps)
+                for opp in opps:
+                    self.opportunity_found.emit(opp)
 
                 self.progress.emit(i + 1, total)
 
@@ -83,53 +77,99 @@ class ArbitrageScannerThread(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
-    def find_opportunities(self, token, tracked, prices):
+    def build_price_matrix(self, token_symbols, all_prices):
         """
-        Find arbitrage opportunities for a token.
+        Stack fetched prices into a (tokens x DEXes) array.
 
         Args:
-            token: Token object
-            tracked: TrackedToken object
-            prices: Dict of {dex_key: price}
+            token_symbols: Token symbols in tracked order
+            all_prices: Dict of {symbol: {dex_key: price_data}}
 
         Returns:
-            List of opportunity dicts
+            (T, D) float64 array in dex_keys column order, NaN where missing
         """
-        opportunities = []
-        dex_list = list(prices.items())
-
-        for i, (buy_dex, buy_price) in enumerate(dex_list):
-            for sell_dex, sell_price in dex_list[i+1:]:
-                if buy_price >= sell_price:
-                    continue
-
-                # Calculate profit
-                profit_usd = sell_price - buy_price
-                profit_pct = (profit_usd / buy_price * 100) if buy_price > 0 else 0
-
-                # Check threshold
-                threshold_met = False
-                if tracked.threshold_mode == "percentage":
-                    threshold_met = profit_pct >= tracked.threshold_value
-                else:  # dollar
-                    threshold_met = profit_usd >= tracked.threshold_value
-
-                opportunity = {
+        prices = np.full((len(token_symbols), len(self.dex_keys)), np.nan, dtype=np.float64)
+
+        for row, symbol in enumerate(token_symbols):
+            dex_prices = all_prices.get(symbol)
+            if not dex_prices:
+                continue
+            for col, dex_key in enumerate(self.dex_keys):
+                price_data = dex_prices.get(dex_key)
+                if price_data and price_data.price_usd:
+                    prices[row, col] = price_data.price_usd
+
+        return prices
+
+    def find_opportunities(self, prices):
+        """
+        Find arbitrage opportunities for all tracked tokens.
+
+        Profits and threshold checks are computed for every token and DEX
+        pair in one pass; only building the result dicts is per token.
+
+        Args:
+            prices: (T, D) array from build_price_matrix
+
+        Returns:
+            List with one list of opportunity dicts per tracked token,
+            each sorted by profit percentage descending
+        """
+        buy = prices[:, self._buy_cols]
+        sell = prices[:, self._sell_cols]
+
+        # Missing prices are NaN and never compare as less than
+        valid = buy < sell
+
+        # Calculate profit
+        profit_usd = sell - buy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            profit_pct = np.where(buy > 0, profit_usd / buy * 100, 0.0)
+
+        # Check threshold
+        threshold_values = np.array(
+            [tracked.threshold_value for _, tracked in self.tracked_tokens], dtype=np.float64
+        )
+        percentage_mode = np.array(
+            [tracked.threshold_mode == "percentage" for _, tracked in self.tracked_tokens], dtype=bool
+        )
+        threshold_met = np.where(
+            percentage_mode[:, None],
+            profit_pct >= threshold_values[:, None],
+            profit_usd >= threshold_values[:, None]
+        )
+
+        results = []
+        for row, (token, tracked) in enumerate(self.tracked_tokens):
+            pairs = np.flatnonzero(valid[row])
+
+            # Sort by profit percentage descending (stable, like list.sort)
+            pairs = pairs[np.argsort(-profit_pct[row, pairs], kind='stable')]
+
+            opportunities = []
+            for pair, buy_price, sell_price, usd, pct, met in zip(
+                pairs.tolist(),
+                buy[row, pairs].tolist(),
+                sell[row, pairs].tolist(),
+                profit_usd[row, pairs].tolist(),
+                profit_pct[row, pairs].tolist(),
+                threshold_met[row, pairs].tolist()
+            ):
+                opportunities.append({
                     'token_id': token.id,
                     'symbol': token.symbol,
                     'name': token.name,
-                    'buy_dex': buy_dex,
+                    'buy_dex': self.dex_keys[self._buy_cols[pair]],
                     'buy_price': buy_price,
-                    'sell_dex': sell_dex,
+                    'sell_dex': self.dex_keys[self._sell_cols[pair]],
                     'sell_price': sell_price,
-                    'profit_usd': profit_usd,
-                    'profit_pct': profit_pct,
+                    'profit_usd': usd,
+                    'profit_pct': pct,
                     'threshold_value': tracked.threshold_value,
                     'threshold_mode': tracked.threshold_mode,
-                    'threshold_met': threshold_met
-                }
-                opportunities.append(opportunity)
+                    'threshold_met': met
+                })
+
+            results.append(opportunities)
 
-        # Sort by profit percentage descending
-        opportunities.sort(key=lambda x: x['profit_pct'], reverse=True)
-        return opportunities
+        return results
@@ -4,6 +4,7 @@ Background thread for fetching token prices from multiple DEXes.
 """
 
 from PySide6.QtCore import QThread, Signal
+from config import Config
 
 
 class PriceFetcherThread(QThread):
@@ -12,7 +13,8 @@ class PriceFetcherThread(QThread):
     """
 
     # Signals
-    price_fetched = Signal(str, str, dict)  # symbol, dex_key, price_data
+    prices_fetched = Signal(dict)  # {symbol: {dex_key: price_data}}
+    batch_ready = Signal(dict)  # {symbol: {dex_key: price_usd}}
     progress = Signal(int, int)  # current, total
     finished = Signal()
     error = Signal(str)
@@ -29,7 +31,7 @@ class PriceFetcherThread(QThread):
         super().__init__()
         self.tokens = tokens
         self.data_service = data_service
-        self.dex_keys = dex_keys or ["uniswap_v3", "pancakeswap_v3", "sushiswap", "curve"]
+        self.dex_keys = dex_keys or Config.DEX_KEYS
 
     def run(self):
         """
@@ -50,10 +52,10 @@ class PriceFetcherThread(QThread):
                 token_symbols,
                 self.dex_keys
             )
+            self.prices_fetched.emit(all_prices)
 
-            # Step 2: Emit results for each token-DEX combination
-            total_operations = len(self.tokens) * len(self.dex_keys)
-            current = 0
+            # Step 2: Aggregate results and emit them with a single signal
+            batch = {}
 
             for token in self.tokens:
                 if self.isInterruptionRequested():
@@ -61,13 +63,18 @@ class PriceFetcherThread(QThread):
 
                 symbol = token.symbol
                 if symbol in all_prices:
-                    for dex_key in self.dex_keys:
-                        if dex_key in all_prices[symbol]:
-                            price_data = all_prices[symbol][dex_key]
-                            self.price_fetched.emit(symbol, dex_key, price_data)
+                    dex_prices = all_prices[symbol]
+                    token_prices = {
+                        dex_key: dex_prices[dex_key].price_usd
+                        for dex_key in self.dex_keys
+                        if dex_key in dex_prices
+                    }
+                    # Only tokens with at least one price reach the table
+                    if token_prices:
+                        batch[symbol] = token_prices
 
-                        current += 1
-                        self.progress.emit(current, total_operations)
+            self.batch_ready.emit(batch)
+            self.progress.emit(1, 1)
 
         except Exception as e:
             self.error.emit(str(e))
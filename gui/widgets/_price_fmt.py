@@ -0,0 +1,48 @@
+"""
+Vectorized price statistics for the Current Prices table.
+Computes best/worst/spread for all rows at once; string formatting stays in Python.
+"""
+
+import numpy as np
+
+
+def build_price_matrix(rows, dex_keys):
+    """
+    Stack per-token DEX prices into a 2D array.
+
+    Args:
+        rows: List of {dex_key: price} dicts, one per token
+        dex_keys: DEX keys in column order
+
+    Returns:
+        (N, D) float64 array with NaN for missing or non-positive prices
+    """
+    matrix = np.array(
+        [[prices.get(dex_key, 0.0) for dex_key in dex_keys] for prices in rows],
+        dtype=np.float64
+    ).reshape(len(rows), len(dex_keys))
+    matrix[~(matrix > 0)] = np.nan
+    return matrix
+
+
+def compute_stats(prices):
+    """
+    Compute best price, worst price and spread % for every row.
+
+    Args:
+        prices: (N, D) array from build_price_matrix
+
+    Returns:
+        Tuple of (best, worst, spread) arrays of length N.
+        Rows without any valid price are NaN in all three.
+    """
+    valid = ~np.isnan(prices)
+    has_prices = valid.any(axis=1)
+
+    best = np.where(valid, prices, -np.inf).max(axis=1, initial=-np.inf)
+    worst = np.where(valid, prices, np.inf).min(axis=1, initial=np.inf)
+    best[~has_prices] = np.nan
+    worst[~has_prices] = np.nan
+
+    spread = (best - worst) / worst * 100
+    return best, worst, spread
@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QHeaderView, QPushButton, QLabel, QCheckBox, QFrame, QMenu, QMessageBox
 )
 from PySide6.QtCore import Qt, Signal, Slot, QTimer
-from PySide6.QtGui import QColor, QAction
+from PySide6.QtGui import QColor, QAction, QGuiApplication
 
 from gui.threads.arbitrage_scanner import ArbitrageScannerThread
 from utils import format_price
@@ -298,9 +298,7 @@ class ArbitrageTable(QWidget):
 
     def copy_to_clipboard(self, text):
         """Copy text to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        QGuiApplication.clipboard().setText(text)
 
     def scan_now(self):
         """Public method to trigger scan from outside."""
@@ -3,12 +3,14 @@ Available Tokens Table widget for DEX Analyzer.
 Displays all available tokens with checkboxes for selection.
 """
 
+from contextlib import contextmanager
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
     QHeaderView, QLineEdit, QPushButton, QLabel, QMessageBox, QMenu
 )
 from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QColor, QAction
+from PySide6.QtGui import QColor, QAction, QGuiApplication
 
 
 class AvailableTokensTable(QWidget):
@@ -34,6 +36,7 @@ class AvailableTokensTable(QWidget):
         self.theme_manager = theme_manager
         self.selected_tokens = set()  # Set of selected token IDs
         self.all_tokens = []  # All available tokens
+        self._defer = False  # Defer selection count updates during bulk changes
 
         self.setup_ui()
         self.load_tokens()
@@ -106,6 +109,7 @@ class AvailableTokensTable(QWidget):
         # Enable context menu
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
+        self.create_context_menu()
 
         layout.addWidget(self.table)
 
@@ -162,16 +166,14 @@ class AvailableTokensTable(QWidget):
         # Get available (non-tracked) tokens
         self.all_tokens = self.token_manager.get_available_tokens()
 
-        # Clear table
-        self.table.setRowCount(0)
-        self.selected_tokens.clear()
-
-        # Populate table
-        for token in self.all_tokens:
-            self.add_token_row(token)
+        with self._bulk():
+            # Clear table
+            self.table.setRowCount(0)
+            self.selected_tokens.clear()
 
-        # Update selection count
-        self.update_selection_count()
+            # Populate table
+            for token in self.all_tokens:
+                self.add_token_row(token)
 
     def add_token_row(self, token):
         """
@@ -262,10 +264,30 @@ class AvailableTokensTable(QWidget):
             # Update UI
             self.update_selection_count()
 
+    @contextmanager
+    def _bulk(self):
+        """
+        Batch multiple check state changes into a single selection count update.
+
+        Table signals are blocked for the duration, so no itemChanged is emitted
+        per toggled row.
+        """
+        self._defer = True
+        signals_blocked = self.table.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.table.blockSignals(signals_blocked)
+            self._defer = False
+            self.update_selection_count()
+
     def update_selection_count(self):
         """
         Update selection count label and button state.
         """
+        if self._defer:
+            return
+
         count = len(self.selected_tokens)
         self.selection_label.setText(f"Selected: {count}")
         self.add_button.setEnabled(count > 0)
@@ -343,6 +365,36 @@ class AvailableTokensTable(QWidget):
                 f"Failed to add tokens: {str(e)}"
             )
 
+    def create_context_menu(self):
+        """
+        Create the context menu once; show_context_menu only updates it.
+        """
+        self._ctx_row = -1
+        self._ctx_menu = QMenu(self)
+
+        # Toggle selection action
+        self._ctx_toggle_action = QAction("Select", self)
+        self._ctx_toggle_action.triggered.connect(self._on_ctx_toggle)
+        self._ctx_menu.addAction(self._ctx_toggle_action)
+
+        self._ctx_menu.addSeparator()
+
+        # Add to tracked action
+        self._ctx_add_action = QAction("Add to Tracked", self)
+        self._ctx_add_action.triggered.connect(self._on_ctx_add)
+        self._ctx_menu.addAction(self._ctx_add_action)
+
+        self._ctx_menu.addSeparator()
+
+        # Copy actions
+        self._ctx_copy_symbol_action = QAction("Copy Symbol", self)
+        self._ctx_copy_symbol_action.triggered.connect(self._on_ctx_copy_symbol)
+        self._ctx_menu.addAction(self._ctx_copy_symbol_action)
+
+        self._ctx_copy_name_action = QAction("Copy Name", self)
+        self._ctx_copy_name_action.triggered.connect(self._on_ctx_copy_name)
+        self._ctx_menu.addAction(self._ctx_copy_name_action)
+
     @Slot()
     def show_context_menu(self, position):
         """
@@ -356,42 +408,34 @@ class AvailableTokensTable(QWidget):
         if not item:
             return
 
-        row = item.row()
-        token_id = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-        symbol = self.table.item(row, 1).text()
-        name = self.table.item(row, 2).text()
+        self._ctx_row = item.row()
+        symbol = self.table.item(self._ctx_row, 1).text()
 
-        # Create context menu
-        menu = QMenu(self)
-
-        # Toggle selection action
-        checkbox_item = self.table.item(row, 0)
+        # Update action texts for this row
+        checkbox_item = self.table.item(self._ctx_row, 0)
         is_checked = checkbox_item.checkState() == Qt.CheckState.Checked
+        self._ctx_toggle_action.setText("Unselect" if is_checked else "Select")
+        self._ctx_add_action.setText(f"Add '{symbol}' to Tracked")
 
-        toggle_action = QAction("Unselect" if is_checked else "Select", self)
-        toggle_action.triggered.connect(lambda: self.toggle_token_selection(row))
-        menu.addAction(toggle_action)
-
-        menu.addSeparator()
-
-        # Add to tracked action
-        add_action = QAction(f"Add '{symbol}' to Tracked", self)
-        add_action.triggered.connect(lambda: self.add_single_token(token_id))
-        menu.addAction(add_action)
+        # Show menu
+        self._ctx_menu.exec(self.table.viewport().mapToGlobal(position))
 
-        menu.addSeparator()
+    @Slot()
+    def _on_ctx_toggle(self):
+        self.toggle_token_selection(self._ctx_row)
 
-        # Copy actions
-        copy_symbol_action = QAction("Copy Symbol", self)
-        copy_symbol_action.triggered.connect(lambda: self.copy_to_clipboard(symbol))
-        menu.addAction(copy_symbol_action)
+    @Slot()
+    def _on_ctx_add(self):
+        token_id = self.table.item(self._ctx_row, 0).data(Qt.ItemDataRole.UserRole)
+        self.add_single_token(token_id)
 
-        copy_name_action = QAction("Copy Name", self)
-        copy_name_action.triggered.connect(lambda: self.copy_to_clipboard(name))
-        menu.addAction(copy_name_action)
+    @Slot()
+    def _on_ctx_copy_symbol(self):
+        self.copy_to_clipboard(self.table.item(self._ctx_row, 1).text())
 
-        # Show menu
-        menu.exec(self.table.viewport().mapToGlobal(position))
+    @Slot()
+    def _on_ctx_copy_name(self):
+        self.copy_to_clipboard(self.table.item(self._ctx_row, 2).text())
 
     def toggle_token_selection(self, row):
         """Toggle selection for a token."""
@@ -444,9 +488,7 @@ class AvailableTokensTable(QWidget):
 
     def copy_to_clipboard(self, text):
         """Copy text to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        QGuiApplication.clipboard().setText(text)
 
     def refresh(self):
         """
@@ -3,22 +3,164 @@ Current Prices Table widget for DEX Analyzer.
 Displays real-time prices from multiple DEXes.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QHeaderView, QPushButton, QLabel, QCheckBox, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, Slot, QTimer
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
 from PySide6.QtGui import QColor
 
+from config import Config
 from gui.threads.price_fetcher import PriceFetcherThread
+from gui.widgets._price_fmt import build_price_matrix, compute_stats
 from utils import format_price
 
+# Prices repeat across refreshes, so memoize the string formatting
+_fmt = lru_cache(maxsize=8192)(format_price)
+
+# Spread text keyed by spread in hundredths of a percent
+_spread_texts = {}
+
+
+def _fmt_spread(spread):
+    key = round(spread * 100)
+    text = _spread_texts.get(key)
+    if text is None:
+        text = _spread_texts[key] = f"{key / 100:.2f}%"
+    return text
+
+
+class CurrentPricesModel(QAbstractTableModel):
+    """
+    Table model for current DEX prices.
+    Stores raw floats per row and formats/colors cells on demand.
+    """
+
+    HEADERS = [
+        "Symbol", "Name", "Uniswap V3", "PancakeSwap V3",
+        "SushiSwap", "Curve", "Best Price", "Worst Price", "Spread %"
+    ]
+    BEST_COL = 6
+    WORST_COL = 7
+    SPREAD_COL = 8
+
+    # Spread highlight colors
+    _GREEN = QColor(0x00, 0xff, 0x88)
+    _GOLD = QColor(0xff, 0xd7, 0x00)
+
+    _ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+    # Roles answered by data(); the view asks for many more on every paint
+    _ROLES = frozenset({
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.TextAlignmentRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.UserRole,
+    })
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tokens = []  # Token per row
+        self._prices = []  # DEX prices per row (NaN if missing)
+        self._best = []
+        self._worst = []
+        self._spread = []
+
+    def set_rows(self, tokens, prices, best, worst, spread):
+        """
+        Replace all rows.
+
+        Args:
+            tokens: List of Token objects
+            prices: Per-row lists of DEX prices (NaN if missing)
+            best: Per-row best price (NaN if none)
+            worst: Per-row worst price (NaN if none)
+            spread: Per-row spread in percent (NaN if none)
+        """
+        self.beginResetModel()
+        self._tokens = tokens
+        self._prices = prices
+        self._best = best
+        self._worst = worst
+        self._spread = spread
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tokens)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role not in self._ROLES:
+            return None
+
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return self._tokens[row].symbol
+            if col == 1:
+                return self._tokens[row].name
+
+            value = self._value(row, col)
+            if col < self.BEST_COL:
+                return _fmt(value) if value > 0 else "N/A"
+            if not self._best[row] > 0:
+                return None
+            if col == self.SPREAD_COL:
+                return _fmt_spread(value)
+            return _fmt(value)
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col == 0:
+                return Qt.AlignmentFlag.AlignCenter
+            if col == 1:
+                return None
+            return self._ALIGN_RIGHT
+
+        if role == Qt.ItemDataRole.ForegroundRole and col == self.SPREAD_COL:
+            spread = self._spread[row]
+            return self._GREEN if spread >= 2.0 else self._GOLD if spread >= 1.0 else None
+
+        if role == Qt.ItemDataRole.UserRole:
+            # Sort key: raw values instead of formatted text
+            if col == 0:
+                return self._tokens[row].symbol
+            if col == 1:
+                return self._tokens[row].name
+            value = self._value(row, col)
+            return value if value == value else -1.0  # NaN sorts first
+
+        return None
+
+    def _value(self, row, col):
+        if col < self.BEST_COL:
+            return self._prices[row][col - 2]
+        if col == self.BEST_COL:
+            return self._best[row]
+        if col == self.WORST_COL:
+            return self._worst[row]
+        return self._spread[row]
+
 
 class CurrentPricesTable(QWidget):
     """
     Table widget showing current prices from multiple DEXes.
     """
 
+    DEX_KEYS = Config.DEX_KEYS
+
     def __init__(self, token_manager, data_service, theme_manager, parent=None):
         super().__init__(parent)
 
@@ -27,6 +169,8 @@ class CurrentPricesTable(QWidget):
         self.theme_manager = theme_manager
         self.fetcher_thread = None
         self.prices_cache = {}  # {symbol: {dex: price}}
+        self._fetch_tracked = None  # Tracked tokens used for the current fetch
+        self._last_fingerprint = None  # Fingerprint of prices shown in the table
 
         # Auto-refresh timer
         self.refresh_timer = QTimer(self)
@@ -60,15 +204,16 @@ class CurrentPricesTable(QWidget):
         layout.addLayout(controls)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "Symbol", "Name", "Uniswap V3", "PancakeSwap V3",
-            "SushiSwap", "Curve", "Best Price", "Worst Price", "Spread %"
-        ])
-
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.model = CurrentPricesModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(Qt.ItemDataRole.UserRole)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
         self.table.verticalHeader().setVisible(False)
@@ -94,11 +239,6 @@ class CurrentPricesTable(QWidget):
 
     @Slot()
     def on_refresh_clicked(self):
-        tracked = self.token_manager.get_tracked_tokens()
-        if not tracked:
-            self.status_label.setText("No tracked tokens")
-            return
-
         self.refresh_prices()
 
     def refresh_prices(self):
@@ -109,27 +249,33 @@ class CurrentPricesTable(QWidget):
         tokens = [t for t, _ in tracked]
 
         if not tokens:
+            self.status_label.setText("No tracked tokens")
             return
 
+        self._fetch_tracked = tracked
+
         self.refresh_btn.setEnabled(False)
         self.status_label.setText("Fetching prices...")
         self.prices_cache.clear()
 
         self.fetcher_thread = PriceFetcherThread(tokens, self.data_service)
-        self.fetcher_thread.price_fetched.connect(self.on_price_received)
+        self.fetcher_thread.batch_ready.connect(self.on_batch_received)
         self.fetcher_thread.finished.connect(self.on_fetch_complete)
         self.fetcher_thread.error.connect(self.on_fetch_error)
         self.fetcher_thread.start()
 
-    @Slot(str, str, dict)
-    def on_price_received(self, symbol, dex_key, price_data):
-        if symbol not in self.prices_cache:
-            self.prices_cache[symbol] = {}
-        self.prices_cache[symbol][dex_key] = price_data.get('price_usd', 0.0)
+    @Slot(dict)
+    def on_batch_received(self, batch):
+        self.prices_cache.update(batch)
 
     @Slot()
     def on_fetch_complete(self):
-        self.update_table()
+        # Skip the rebuild if prices are unchanged since the last tick
+        fingerprint = self._prices_fingerprint()
+        if fingerprint != self._last_fingerprint:
+            self.update_table()
+            self._last_fingerprint = fingerprint
+
         self.refresh_btn.setEnabled(True)
 
         # Show results or warning if no prices fetched
@@ -155,58 +301,35 @@ class CurrentPricesTable(QWidget):
             f"An error occurred while fetching prices:\n{error_msg}\n\nPlease try again later."
         )
 
-    def update_table(self):
-        tracked = self.token_manager.get_tracked_tokens()
-        self.table.setRowCount(0)
-
-        for token, _ in tracked:
-            if token.symbol in self.prices_cache:
-                self.add_price_row(token, self.prices_cache[token.symbol])
-
-    def add_price_row(self, token, prices):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        # Symbol & Name
-        self.table.setItem(row, 0, self.create_center_item(token.symbol))
-        self.table.setItem(row, 1, QTableWidgetItem(token.name))
-
-        # DEX prices
-        dex_keys = ["uniswap_v3", "pancakeswap_v3", "sushiswap", "curve"]
-        price_values = []
-
-        for i, dex_key in enumerate(dex_keys, start=2):
-            price = prices.get(dex_key, 0.0)
-            price_values.append(price)
-            price_text = format_price(price) if price > 0 else "N/A"
-            self.table.setItem(row, i, self.create_right_item(price_text))
-
-        # Best/Worst/Spread
-        valid_prices = [p for p in price_values if p > 0]
-        if valid_prices:
-            best = max(valid_prices)
-            worst = min(valid_prices)
-            spread = ((best - worst) / worst * 100) if worst > 0 else 0
-
-            self.table.setItem(row, 6, self.create_right_item(format_price(best)))
-            self.table.setItem(row, 7, self.create_right_item(format_price(worst)))
-
-            spread_item = self.create_right_item(f"{spread:.2f}%")
-            if spread >= 2.0:
-                spread_item.setForeground(QColor("#00ff88"))
-            elif spread >= 1.0:
-                spread_item.setForeground(QColor("#ffd700"))
-            self.table.setItem(row, 8, spread_item)
-
-    def create_center_item(self, text):
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        return item
-
-    def create_right_item(self, text):
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        return item
+    def update_table(self, tracked=None):
+        """
+        Rebuild the table from prices_cache.
+
+        Args:
+            tracked: List of (Token, TrackedToken) tuples to display
+                     (default: the list used for the last fetch)
+        """
+        if tracked is not None:
+            self._fetch_tracked = tracked
+        elif self._fetch_tracked is None:
+            self._fetch_tracked = self.token_manager.get_tracked_tokens()
+
+        self._last_fingerprint = None
+
+        tokens = [token for token, _ in self._fetch_tracked if token.symbol in self.prices_cache]
+
+        # Best/Worst/Spread for all rows in one vectorized pass
+        matrix = build_price_matrix([self.prices_cache[t.symbol] for t in tokens], self.DEX_KEYS)
+        best, worst, spread = (stat.tolist() for stat in compute_stats(matrix))
+
+        self.model.set_rows(tokens, matrix.tolist(), best, worst, spread)
+
+    def _prices_fingerprint(self):
+        """Hash of prices_cache used to detect unchanged refreshes."""
+        return hash(tuple(sorted(
+            (symbol, tuple(sorted(dex_prices.items())))
+            for symbol, dex_prices in self.prices_cache.items()
+        )))
 
     @Slot(int)
     def toggle_auto_refresh(self, state):
@@ -216,6 +339,11 @@ class CurrentPricesTable(QWidget):
         else:
             self.refresh_timer.stop()
 
+    def invalidate_tracked(self):
+        """Drop the cached tracked tokens list after tracking changes."""
+        self._fetch_tracked = None
+        self._last_fingerprint = None
+
     def refresh(self):
         if self.auto_refresh_cb.isChecked():
             self.refresh_prices()
@@ -16,6 +16,28 @@ class ThresholdEditDialog(QDialog):
     Dialog for editing token arbitrage threshold and mode.
     """
 
+    # Shared by every dialog instance; built on first use (needs a QApplication)
+    _validator = None
+
+    @classmethod
+    def _get_validator(cls):
+        """
+        Get the shared threshold value validator.
+
+        Returns:
+            QDoubleValidator accepting 0.0 to 1000.0 with 2 decimal places
+        """
+        if cls._validator is None:
+            validator = QDoubleValidator(0.0, 1000.0, 2)
+            validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+
+            # Use C locale to ensure dot (.) is used as decimal separator
+            validator.setLocale(QLocale(QLocale.Language.C))
+
+            cls._validator = validator
+
+        return cls._validator
+
     def __init__(self, token_symbol, current_value, current_mode, parent=None):
         """
         Initialize threshold edit dialog.
@@ -67,14 +89,7 @@ class ThresholdEditDialog(QDialog):
         self.value_input.setPlaceholderText("Enter threshold value")
 
         # Set validator for numeric input (0.0 to 1000.0, 2 decimal places)
-        validator = QDoubleValidator(0.0, 1000.0, 2)
-        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
-
-        # Use C locale to ensure dot (.) is used as decimal separator
-        c_locale = QLocale(QLocale.Language.C)
-        validator.setLocale(c_locale)
-
-        self.value_input.setValidator(validator)
+        self.value_input.setValidator(self._get_validator())
 
         value_layout.addWidget(self.value_input)
         layout.addLayout(value_layout)
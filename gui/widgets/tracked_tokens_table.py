@@ -4,15 +4,267 @@ Displays tracked tokens with editable thresholds.
 """
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QPushButton, QLabel, QMessageBox, QMenu, QDialog
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
+    QHeaderView, QPushButton, QLabel, QMessageBox, QMenu, QDialog,
+    QStyledItemDelegate, QStyle, QStyleOptionButton, QApplication
 )
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QColor, QAction
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QEvent
+)
+from PySide6.QtGui import QColor, QBrush, QAction, QGuiApplication, QPalette
 
 from gui.widgets.threshold_dialog import ThresholdEditDialog
 
 
+# Placeholder market columns shown until the first price refresh
+_NO_MARKET_DATA = ("$0.00", "Low", "$0")
+
+# Bound format methods for the per-cell texts built in data()
+_FMT_THRESHOLD = "{:.2f}".format
+_FMT_STOP_TRACKING = "Stop tracking {}".format
+
+
+class TrackedTokensModel(QAbstractTableModel):
+    """
+    Table model over the (Token, TrackedToken) list from TokenManager.
+
+    Cell text is produced on demand in data(), so a refresh only resets
+    the row list instead of rebuilding per-cell items.
+    """
+
+    HEADERS = [
+        "Symbol", "Token Name", "Price (USD)", "Volatility",
+        "Liquidity", "Threshold", "Mode", "Actions"
+    ]
+    PRICE_COL = 2
+    LIQUIDITY_COL = 4
+    THRESHOLD_COL = 5
+    MODE_COL = 6
+    ACTIONS_COL = 7
+
+    _ALIGN_RIGHT_VCENTER = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    _ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+    # Roles answered by data(); the view asks for many more on every paint
+    _ROLES = frozenset({
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.TextAlignmentRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.ToolTipRole,
+        Qt.ItemDataRole.UserRole,
+    })
+
+    def __init__(self, theme_manager, parent=None):
+        """
+        Initialize tracked tokens model.
+
+        Args:
+            theme_manager: ThemeManager instance for theming
+            parent: Parent object
+        """
+        super().__init__(parent)
+
+        self.theme_manager = theme_manager
+        self._rows = []  # [(Token, TrackedToken)]
+        self._market = {}  # {symbol: (price_text, volatility, liquidity_text)}
+
+        # Accent for editable columns, rebuilt only when the theme changes
+        self._accent_brush = self._make_accent_brush()
+        self.theme_manager.theme_changed.connect(self.on_theme_changed)
+
+    def _make_accent_brush(self):
+        """Build the accent brush for the current theme."""
+        return QBrush(QColor("#14ffec" if self.theme_manager.is_dark_theme() else "#0066cc"))
+
+    @Slot(str)
+    def on_theme_changed(self, theme_name):
+        """
+        Rebuild the cached accent brush after a theme switch.
+
+        Args:
+            theme_name: Name of the applied theme
+        """
+        self._accent_brush = self._make_accent_brush()
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, self.THRESHOLD_COL),
+                self.index(len(self._rows) - 1, self.MODE_COL),
+                [Qt.ItemDataRole.ForegroundRole]
+            )
+
+    def set_rows(self, rows):
+        """
+        Replace all rows with a single model reset.
+
+        Args:
+            rows: List of (Token, TrackedToken) tuples
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_data(self, row):
+        """
+        Get the (Token, TrackedToken) tuple for a source row.
+
+        Args:
+            row: Source row index
+
+        Returns:
+            (Token, TrackedToken) tuple
+        """
+        return self._rows[row]
+
+    def set_market_data(self, market):
+        """
+        Merge new price, volatility and liquidity texts.
+
+        Only the market columns are announced as changed, so the
+        token and threshold cells are not re-queried.
+
+        Args:
+            market: Dict {symbol: (price_text, volatility, liquidity_text)}
+        """
+        self._market.update(market)
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, self.PRICE_COL),
+                self.index(len(self._rows) - 1, self.LIQUIDITY_COL)
+            )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role not in self._ROLES or not index.isValid():
+            return None
+
+        token, tracked_token = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return token.symbol
+            if col == 1:
+                return token.name
+            if col <= self.LIQUIDITY_COL:
+                return self._market.get(token.symbol, _NO_MARKET_DATA)[col - self.PRICE_COL]
+            if col == self.THRESHOLD_COL:
+                return _FMT_THRESHOLD(tracked_token.threshold_value)
+            if col == self.MODE_COL:
+                return "%" if tracked_token.threshold_mode == "percentage" else "$"
+            return None
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col in (0, 3, self.MODE_COL):
+                return self._ALIGN_CENTER
+            if col in (self.PRICE_COL, self.LIQUIDITY_COL, self.THRESHOLD_COL):
+                return self._ALIGN_RIGHT_VCENTER
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # Make editable columns visually distinct
+            if col in (self.THRESHOLD_COL, self.MODE_COL):
+                return self._accent_brush
+            return None
+
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if col == self.ACTIONS_COL:
+                return _FMT_STOP_TRACKING(token.symbol)
+            return None
+
+        if role == Qt.ItemDataRole.UserRole:
+            return token.id
+
+        return None
+
+
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a "Remove" button in each cell instead of a per-row QPushButton.
+    """
+
+    # Signals
+    remove_requested = Signal(int, str)  # token_id, symbol
+
+    def __init__(self, parent=None):
+        """
+        Initialize remove button delegate.
+
+        Args:
+            parent: Parent view
+        """
+        super().__init__(parent)
+
+        # Hidden template button so the #dangerButton stylesheet rules apply
+        self._template = QPushButton("Remove", parent)
+        self._template.setObjectName("dangerButton")
+        self._template.hide()
+        self._template.ensurePolished()
+
+        self._pressed = None  # (row, column) of the cell being pressed
+
+    def _button_option(self, option, index):
+        """Build the style option for the button painted in a cell."""
+        button = QStyleOptionButton()
+        button.initFrom(self._template)
+        button.rect = option.rect.adjusted(4, 3, -4, -3)
+        button.text = "Remove"
+        button.state |= QStyle.StateFlag.State_Enabled
+        if self._pressed == (index.row(), index.column()):
+            button.state |= QStyle.StateFlag.State_Sunken
+        else:
+            button.state |= QStyle.StateFlag.State_Raised
+        return button
+
+    def paint(self, painter, option, index):
+        button = self._button_option(option, index)
+        style = self._template.style() or QApplication.style()
+
+        # Bevel and label are drawn separately: the stylesheet padding is
+        # sized for toolbar buttons and would clip the label in a table row
+        style.drawControl(QStyle.ControlElement.CE_PushButtonBevel, button, painter, self._template)
+        style.drawItemText(
+            painter,
+            button.rect,
+            Qt.AlignmentFlag.AlignCenter,
+            button.palette,
+            True,
+            button.text,
+            QPalette.ColorRole.ButtonText
+        )
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+
+        if event_type == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+            if option.rect.contains(event.position().toPoint()):
+                self._pressed = (index.row(), index.column())
+                return True
+
+        elif event_type == QEvent.Type.MouseButtonRelease and self._pressed is not None:
+            clicked = (
+                self._pressed == (index.row(), index.column())
+                and option.rect.contains(event.position().toPoint())
+            )
+            self._pressed = None
+            if clicked:
+                token_id = index.data(Qt.ItemDataRole.UserRole)
+                symbol = index.siblingAtColumn(0).data()
+                self.remove_requested.emit(token_id, symbol)
+            return True
+
+        return super().editorEvent(event, model, option, index)
+
+
 class TrackedTokensTable(QWidget):
     """
     Table widget showing tracked tokens with editable thresholds.
@@ -36,6 +288,12 @@ class TrackedTokensTable(QWidget):
         self.token_manager = token_manager
         self.theme_manager = theme_manager
 
+        # Set when a refresh is requested while the tab is hidden
+        self._refresh_pending = False
+
+        # (token_id, threshold_value, threshold_mode) per row currently shown
+        self._last_signature = None
+
         self.setup_ui()
         self.load_tokens()
 
@@ -64,22 +322,37 @@ class TrackedTokensTable(QWidget):
 
         layout.addLayout(header_layout)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "Symbol", "Token Name", "Price (USD)", "Volatility",
-            "Liquidity", "Threshold", "Mode", "Actions"
-        ])
+        # Table (sorting goes through a proxy so the model is never re-populated)
+        self.model = TrackedTokensModel(self.theme_manager, self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        # Sorted on reset and once per market update, not per changed cell
+        self.proxy.setDynamicSortFilter(False)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+
+        # Remove buttons are painted by a delegate, not per-row widgets
+        self.remove_delegate = RemoveButtonDelegate(self.table)
+        self.remove_delegate.remove_requested.connect(
+            self.on_remove_clicked, Qt.ConnectionType.QueuedConnection
+        )
+        self.table.setItemDelegateForColumn(TrackedTokensModel.ACTIONS_COL, self.remove_delegate)
 
         # Configure table
-        self.table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
         self.table.verticalHeader().setVisible(False)
 
+        # Fixed row height and single-line cells; no per-cell size measuring
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(28)
+        self.table.setWordWrap(False)
+        self.table.setTextElideMode(Qt.TextElideMode.ElideRight)
+
         # Column widths
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
@@ -99,11 +372,12 @@ class TrackedTokensTable(QWidget):
         header.resizeSection(7, 110)  # Actions - wider for Remove button
 
         # Connect signals
-        self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        self.table.doubleClicked.connect(self.on_cell_double_clicked)
 
         # Enable context menu
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
+        self.create_context_menu()
 
         layout.addWidget(self.table)
 
@@ -126,12 +400,17 @@ class TrackedTokensTable(QWidget):
         # Get tracked tokens
         tracked = self.token_manager.get_tracked_tokens()
 
-        # Clear table
-        self.table.setRowCount(0)
+        # Skip the reset when the same tokens and thresholds are already shown
+        signature = tuple(
+            (token.id, tracked_token.threshold_value, tracked_token.threshold_mode)
+            for token, tracked_token in tracked
+        )
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
 
-        # Populate table
-        for token, tracked_token in tracked:
-            self.add_token_row(token, tracked_token)
+        # Swap the backing list in one model reset
+        self.model.set_rows(tracked)
 
         # Update info
         count = len(tracked)
@@ -142,106 +421,53 @@ class TrackedTokensTable(QWidget):
         else:
             self.info_label.setText(f"Tracking {count} tokens")
 
-    def add_token_row(self, token, tracked_token):
+    def update_market_data(self, market):
         """
-        Add a tracked token row to the table.
+        Update price, volatility and liquidity columns.
 
         Args:
-            token: Token object
-            tracked_token: TrackedToken object
-        """
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-
-        # Symbol
-        symbol_item = QTableWidgetItem(token.symbol)
-        symbol_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        symbol_item.setData(Qt.ItemDataRole.UserRole, token.id)
-        self.table.setItem(row, 0, symbol_item)
-
-        # Name
-        name_item = QTableWidgetItem(token.name)
-        name_item.setData(Qt.ItemDataRole.UserRole, token.id)
-        self.table.setItem(row, 1, name_item)
-
-        # Price (placeholder)
-        price_item = QTableWidgetItem("$0.00")
-        price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        price_item.setData(Qt.ItemDataRole.UserRole, token.id)
-        self.table.setItem(row, 2, price_item)
-
-        # Volatility (placeholder)
-        volatility_item = QTableWidgetItem("Low")
-        volatility_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        volatility_item.setData(Qt.ItemDataRole.UserRole, token.id)
-        self.table.setItem(row, 3, volatility_item)
-
-        # Liquidity (placeholder)
-        liquidity_item = QTableWidgetItem("$0")
-        liquidity_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        liquidity_item.setData(Qt.ItemDataRole.UserRole, token.id)
-        self.table.setItem(row, 4, liquidity_item)
-
-        # Threshold
-        threshold_text = f"{tracked_token.threshold_value:.2f}"
-        threshold_item = QTableWidgetItem(threshold_text)
-        threshold_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        threshold_item.setData(Qt.ItemDataRole.UserRole, token.id)
-        # Make it visually distinct (editable)
-        threshold_item.setForeground(QColor("#14ffec" if self.theme_manager.is_dark_theme() else "#0066cc"))
-        self.table.setItem(row, 5, threshold_item)
-
-        # Mode
-        mode_text = "%" if tracked_token.threshold_mode == "percentage" else "$"
-        mode_item = QTableWidgetItem(mode_text)
-        mode_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        mode_item.setData(Qt.ItemDataRole.UserRole, token.id)
-        mode_item.setForeground(QColor("#14ffec" if self.theme_manager.is_dark_theme() else "#0066cc"))
-        self.table.setItem(row, 6, mode_item)
-
-        # Remove button
-        remove_btn = QPushButton("Remove")
-        remove_btn.setObjectName("dangerButton")
-        remove_btn.setMinimumWidth(90)
-        remove_btn.setToolTip(f"Stop tracking {token.symbol}")
-        remove_btn.setProperty("token_id", token.id)
-        remove_btn.setProperty("token_symbol", token.symbol)
-        remove_btn.clicked.connect(lambda checked, tid=token.id, sym=token.symbol: self.on_remove_clicked(tid, sym))
-        self.table.setCellWidget(row, 7, remove_btn)
-
-    @Slot(int, int)
-    def on_cell_double_clicked(self, row, col):
+            market: Dict {symbol: (price_text, volatility, liquidity_text)}
         """
-        Handle cell double-click event.
+        self.model.set_market_data(market)
 
-        Args:
-            row: Row index
-            col: Column index
+        # Market columns changed in bulk; re-sort once if ordering depends on them
+        column = self.proxy.sortColumn()
+        if TrackedTokensModel.PRICE_COL <= column <= TrackedTokensModel.LIQUIDITY_COL:
+            self.proxy.sort(column, self.proxy.sortOrder())
+
+    def _row_at(self, index):
         """
-        # Only allow editing threshold and mode columns
-        if col not in [5, 6]:
-            return
+        Get the (Token, TrackedToken) tuple for a view index.
 
-        # Get token info
-        symbol_item = self.table.item(row, 0)
-        if not symbol_item:
-            return
+        Args:
+            index: Proxy model index from the view
 
-        token_id = symbol_item.data(Qt.ItemDataRole.UserRole)
-        token_symbol = symbol_item.text()
+        Returns:
+            (Token, TrackedToken) tuple
+        """
+        return self.model.row_data(self.proxy.mapToSource(index).row())
 
-        # Get current threshold
-        threshold_item = self.table.item(row, 5)
-        mode_item = self.table.item(row, 6)
+    @Slot(QModelIndex)
+    def on_cell_double_clicked(self, index):
+        """
+        Handle cell double-click event.
 
-        if not threshold_item or not mode_item:
+        Args:
+            index: Proxy model index of the clicked cell
+        """
+        # Only allow editing threshold and mode columns
+        if index.column() not in (TrackedTokensModel.THRESHOLD_COL, TrackedTokensModel.MODE_COL):
             return
 
-        current_value = float(threshold_item.text())
-        current_mode = "percentage" if mode_item.text() == "%" else "dollar"
+        token, tracked_token = self._row_at(index)
 
         # Show edit dialog
-        self.show_edit_dialog(token_id, token_symbol, current_value, current_mode)
+        self.show_edit_dialog(
+            token.id,
+            token.symbol,
+            tracked_token.threshold_value,
+            tracked_token.threshold_mode
+        )
 
     def show_edit_dialog(self, token_id, token_symbol, current_value, current_mode):
         """
@@ -286,6 +512,7 @@ class TrackedTokensTable(QWidget):
                     f"Failed to update threshold for {token_symbol}"
                 )
 
+    @Slot(int, str)
     def on_remove_clicked(self, token_id, token_symbol):
         """
         Handle remove button click.
@@ -327,6 +554,36 @@ class TrackedTokensTable(QWidget):
                     f"Failed to remove {token_symbol}"
                 )
 
+    def create_context_menu(self):
+        """
+        Create the context menu once; show_context_menu only updates it.
+        """
+        self._ctx_entry = None  # (Token, TrackedToken) under the cursor
+        self._ctx_menu = QMenu(self)
+
+        # Edit threshold action
+        self._ctx_edit_action = QAction("Edit Threshold", self)
+        self._ctx_edit_action.triggered.connect(self._on_ctx_edit)
+        self._ctx_menu.addAction(self._ctx_edit_action)
+
+        self._ctx_menu.addSeparator()
+
+        # Remove action
+        self._ctx_remove_action = QAction("Stop Tracking", self)
+        self._ctx_remove_action.triggered.connect(self._on_ctx_remove)
+        self._ctx_menu.addAction(self._ctx_remove_action)
+
+        self._ctx_menu.addSeparator()
+
+        # Copy actions
+        self._ctx_copy_symbol_action = QAction("Copy Symbol", self)
+        self._ctx_copy_symbol_action.triggered.connect(self._on_ctx_copy_symbol)
+        self._ctx_menu.addAction(self._ctx_copy_symbol_action)
+
+        self._ctx_copy_threshold_action = QAction("Copy Threshold", self)
+        self._ctx_copy_threshold_action.triggered.connect(self._on_ctx_copy_threshold)
+        self._ctx_menu.addAction(self._ctx_copy_threshold_action)
+
     @Slot()
     def show_context_menu(self, position):
         """
@@ -336,55 +593,69 @@ class TrackedTokensTable(QWidget):
             position: Position where right-click occurred
         """
         # Get selected row
-        item = self.table.itemAt(position)
-        if not item:
+        index = self.table.indexAt(position)
+        if not index.isValid():
             return
 
-        row = item.row()
-        token_id = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-        symbol = self.table.item(row, 0).text()
-
-        # Get current threshold info
-        threshold_value = float(self.table.item(row, 5).text())
-        threshold_mode = "percentage" if self.table.item(row, 6).text() == "%" else "dollar"
+        self._ctx_entry = self._row_at(index)
+        symbol = self._ctx_entry[0].symbol
 
-        # Create context menu
-        menu = QMenu(self)
+        # Update action texts for this row
+        self._ctx_edit_action.setText(f"Edit Threshold for '{symbol}'")
+        self._ctx_remove_action.setText(f"Stop Tracking '{symbol}'")
 
-        # Edit threshold action
-        edit_action = QAction(f"Edit Threshold for '{symbol}'", self)
-        edit_action.triggered.connect(lambda: self.on_cell_double_clicked(row, 5))
-        menu.addAction(edit_action)
-
-        menu.addSeparator()
-
-        # Remove action
-        remove_action = QAction(f"Stop Tracking '{symbol}'", self)
-        remove_action.triggered.connect(lambda: self.on_remove_clicked(token_id, symbol))
-        menu.addAction(remove_action)
+        # Show menu
+        self._ctx_menu.exec(self.table.viewport().mapToGlobal(position))
 
-        menu.addSeparator()
+    @Slot()
+    def _on_ctx_edit(self):
+        token, tracked_token = self._ctx_entry
+        self.show_edit_dialog(
+            token.id,
+            token.symbol,
+            tracked_token.threshold_value,
+            tracked_token.threshold_mode
+        )
 
-        # Copy actions
-        copy_symbol_action = QAction("Copy Symbol", self)
-        copy_symbol_action.triggered.connect(lambda: self.copy_to_clipboard(symbol))
-        menu.addAction(copy_symbol_action)
+    @Slot()
+    def _on_ctx_remove(self):
+        token = self._ctx_entry[0]
+        self.on_remove_clicked(token.id, token.symbol)
 
-        copy_threshold_action = QAction("Copy Threshold", self)
-        copy_threshold_action.triggered.connect(lambda: self.copy_to_clipboard(f"{threshold_value}"))
-        menu.addAction(copy_threshold_action)
+    @Slot()
+    def _on_ctx_copy_symbol(self):
+        self.copy_to_clipboard(self._ctx_entry[0].symbol)
 
-        # Show menu
-        menu.exec(self.table.viewport().mapToGlobal(position))
+    @Slot()
+    def _on_ctx_copy_threshold(self):
+        self.copy_to_clipboard(f"{self._ctx_entry[1].threshold_value}")
 
     def copy_to_clipboard(self, text):
         """Copy text to clipboard."""
-        from PySide6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        QGuiApplication.clipboard().setText(text)
 
     def refresh(self):
         """
         Refresh the table data.
+
+        While the widget is hidden the reload is deferred until it is shown.
         """
+        if not self.isVisible():
+            self._refresh_pending = True
+            return
+
         self.load_tokens()
+
+    def showEvent(self, event):
+        """
+        Replay a deferred refresh when the widget becomes visible.
+
+        Args:
+            event: QShowEvent
+        """
+        super().showEvent(event)
+
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.load_tokens()
+
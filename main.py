@@ -14,15 +14,21 @@ sys.path.insert(0, str(project_root))
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt
 
-from gui.main_window import MainWindow
-from database.migration_manager import MigrationManager
-from database.database_manager import DatabaseManager
+from utils.logging_setup import setup_logging
 
 
 def main():
     """
     Main application entry point.
     """
+    # Enable high DPI scaling (must be set before the application is created)
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+
+    # Provider messages are written by a background thread, not the fetch threads
+    log_listener = setup_logging()
+
     # Create Qt Application
     app = QApplication(sys.argv)
 
@@ -34,12 +40,12 @@ def main():
     # Set global application style
     app.setStyle('Fusion')
 
-    # Enable high DPI scaling
-    QApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-
     try:
+        # Deferred until the QApplication exists; these pull in every widget module
+        from gui.main_window import MainWindow
+        from database.migration_manager import MigrationManager
+        from database.database_manager import DatabaseManager
+
         # Initialize database
         db_manager = DatabaseManager()
 
@@ -55,12 +61,15 @@ def main():
         window.show()
 
         # Start event loop
-        sys.exit(app.exec())
+        exit_code = app.exec()
+        log_listener.stop()
+        sys.exit(exit_code)
 
     except Exception as e:
         print(f"Error starting application: {e}")
         import traceback
         traceback.print_exc()
+        log_listener.stop()
         sys.exit(1)
 
 
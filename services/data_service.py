@@ -5,12 +5,28 @@ This service uses CoinGecko API for real cryptocurrency prices
 and simulates DEX-specific price variations for arbitrage detection.
 """
 
-from typing import Optional, Dict
+import bisect
+import threading
+from typing import NamedTuple, Optional, Dict, List
 from datetime import datetime
 from api.data_providers.coingecko_provider import CoinGeckoProvider
 from utils.cache import SimpleCache
 from config import Config
-import random
+import numpy as np
+
+# Volatility category upper bounds (absolute 24h change, %) and their labels
+_VOLATILITY_THRESHOLDS = (2.0, 5.0, 10.0)
+_VOLATILITY_LABELS = ("Low", "Medium", "High", "Very High")
+
+
+class PricePacket(NamedTuple):
+    """Immutable DEX-specific price data for one token"""
+    price_usd: float
+    volume_24h: float
+    price_change_24h: float
+    liquidity_usd: float
+    last_updated: Optional[str]
+    source: str
 
 
 class DataService:
@@ -23,8 +39,19 @@ class DataService:
         """Initialize data service"""
         self.coingecko = CoinGeckoProvider()
         self.price_cache = SimpleCache(maxsize=1000, ttl=Config.PRICE_CACHE_TTL)
-
-    def get_token_price(self, token_symbol: str, dex_key: str, network: str = "ethereum") -> Optional[Dict]:
+        # CoinGecko base data per symbol; DEX variants can be rebuilt from it without HTTP
+        self.base_cache = SimpleCache(maxsize=500, ttl=Config.PRICE_CACHE_TTL)
+        # Symbols the last bulk fetch did not return; not re-requested until they expire
+        self.negative_cache = SimpleCache(maxsize=500, ttl=Config.NEGATIVE_CACHE_TTL)
+        # Simulated DEX price per (symbol, dex_key, base price_usd)
+        self.variant_cache = SimpleCache(maxsize=2000, ttl=Config.DEX_VARIANT_CACHE_TTL)
+        self._rng = np.random.default_rng()
+        # Refresh threads share these caches (and the RNG); TTLCache is not thread-safe
+        self._cache_lock = threading.Lock()
+        self._all_dex_keys = Config.DEX_KEYS
+        self._source_labels = {dex_key: f"{dex_key}_simulated" for dex_key in Config.DEX_KEYS}
+
+    def get_token_price(self, token_symbol: str, dex_key: str, network: str = "ethereum") -> Optional[PricePacket]:
         """
         Get current price for a token on a specific DEX
 
@@ -34,56 +61,47 @@ class DataService:
             network: Network name (ethereum, bsc, polygon)
 
         Returns:
-            Dict with price data or None if failed
+            PricePacket with price data or None if failed
         """
-        # Create cache key
-        cache_key = self.price_cache.make_key(token_symbol, dex_key)
-
-        # Check cache first
-        cached = self.price_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        # Get base price from CoinGecko
-        base_data = self.coingecko.get_token_price(token_symbol)
-
-        if not base_data:
-            return None
-
-        # Generate DEX-specific price data
-        result = self._generate_dex_price(base_data, dex_key)
+        # Single network path: the bulk fetch handles cache lookup and storage
+        prices = self.get_bulk_prices_all_dexes([token_symbol], [dex_key])
+        return prices.get(token_symbol, {}).get(dex_key)
 
-        # Cache the result
-        self.price_cache.set(cache_key, result)
-
-        return result
-
-    def _generate_dex_price(self, base_data: Dict, dex_key: str) -> Dict:
+    def _simulate_dex_prices(self, base_prices: list) -> np.ndarray:
         """
-        Generate DEX-specific price with simulated variation.
+        Simulate DEX-specific prices for many (token, DEX) pairs at once.
 
         Args:
-            base_data: Base price data from CoinGecko
-            dex_key: DEX key for variation seed
+            base_prices: Base USD price from CoinGecko for each pair
 
         Returns:
-            Dict with DEX-specific price data
+            Array of unrounded simulated DEX prices, one per pair
         """
         # Simulate DEX-specific price variations (0.1-2% difference)
         # In reality, different DEXes have slightly different prices due to liquidity, slippage, etc.
-        variation = random.uniform(0.999, 1.02)  # -0.1% to +2%
-        dex_price = base_data["price_usd"] * variation
+        base = np.asarray(base_prices, dtype=np.float64)
+        variations = self._rng.uniform(0.999, 1.02, size=base.size)  # -0.1% to +2%
+        # Kept at full precision; format_price rounds at display time
+        return base * variations
 
-        return {
-            "price_usd": round(dex_price, 6),
-            "volume_24h": base_data.get("volume_24h", 0),
-            "price_change_24h": base_data.get("price_change_24h", 0),
-            "liquidity_usd": base_data.get("market_cap", 0) * 0.01,  # Estimate ~1% of market cap
-            "last_updated": base_data.get("last_updated"),
-            "source": f"{dex_key}_simulated"
-        }
+    def _shared_dex_fields(self, base_data: Dict) -> tuple:
+        """
+        Build the price data fields that are the same on every DEX.
+
+        Args:
+            base_data: Base price data from CoinGecko
 
-    def get_all_dex_prices(self, token_symbol: str) -> Dict[str, Optional[Dict]]:
+        Returns:
+            Tuple of volume, 24h change, liquidity and update time in PricePacket order
+        """
+        return (
+            base_data.get("volume_24h", 0),
+            base_data.get("price_change_24h", 0),
+            base_data.get("market_cap", 0) * 0.01,  # Liquidity estimate: ~1% of market cap
+            base_data.get("last_updated"),
+        )
+
+    def get_all_dex_prices(self, token_symbol: str) -> Dict[str, PricePacket]:
         """
         Get prices for a token from all available DEXes
 
@@ -91,18 +109,12 @@ class DataService:
             token_symbol: Token symbol
 
         Returns:
-            Dict mapping DEX keys to price data
+            Dict mapping DEX keys to PricePacket
         """
-        results = {}
-
-        for dex_key in Config.DEX_CONFIG.keys():
-            price_data = self.get_token_price(token_symbol, dex_key)
-            if price_data:
-                results[dex_key] = price_data
-
-        return results
+        prices = self.get_bulk_prices_all_dexes([token_symbol], self._all_dex_keys)
+        return prices.get(token_symbol, {})
 
-    def get_bulk_prices_all_dexes(self, token_symbols: list, dex_keys: list = None) -> Dict[str, Dict[str, Dict]]:
+    def get_bulk_prices_all_dexes(self, token_symbols: list, dex_keys: list = None) -> Dict[str, Dict[str, PricePacket]]:
         """
         OPTIMIZED: Get prices for multiple tokens across multiple DEXes with a single API call.
 
@@ -114,13 +126,13 @@ class DataService:
             dex_keys: List of DEX keys (default: all 4 DEXes)
 
         Returns:
-            Nested dict: {symbol: {dex_key: price_data}}
+            Nested dict: {symbol: {dex_key: PricePacket}}
 
         Example:
             result = {
                 'ETH': {
-                    'uniswap_v3': {'price_usd': 3500.25, ...},
-                    'sushiswap': {'price_usd': 3502.10, ...},
+                    'uniswap_v3': PricePacket(price_usd=3500.25, ...),
+                    'sushiswap': PricePacket(price_usd=3502.10, ...),
                     ...
                 },
                 'WBTC': {...}
@@ -129,43 +141,93 @@ class DataService:
         if not token_symbols:
             return {}
 
-        if dex_keys is None:
-            dex_keys = list(Config.DEX_CONFIG.keys())
+        dex_keys = self._all_dex_keys if dex_keys is None else tuple(dex_keys)
 
         # Step 1: Check cache for all combinations
-        cache_hits = {}
-        cache_misses = []
-
-        for symbol in token_symbols:
-            cache_hits[symbol] = {}
-            for dex_key in dex_keys:
-                cache_key = self.price_cache.make_key(symbol, dex_key)
-                cached = self.price_cache.get(cache_key)
-
-                if cached is not None:
-                    # Cache hit
-                    cache_hits[symbol][dex_key] = cached
-                else:
-                    # Cache miss - need to fetch
-                    if symbol not in cache_misses:
-                        cache_misses.append(symbol)
+        # One entry per unique symbol, created in a single pass
+        cache_hits = {symbol: {} for symbol in token_symbols}
+        miss_dexes = {}  # {symbol: [dex_key, ...]} variants missing from the cache
+        cache_misses = set()  # symbols without cached base data
+        base_prices = {}  # base data for every symbol that needs DEX variants
+        price_cache_get = self.price_cache.get
+
+        # Cache sections are locked; the HTTP call below runs unlocked
+        with self._cache_lock:
+            for symbol in cache_hits:
+                if self.negative_cache.get(symbol):
+                    continue
+
+                # Cache hits
+                hits = {
+                    dex_key: cached
+                    for dex_key in dex_keys
+                    if (cached := price_cache_get((symbol, dex_key))) is not None
+                }
+                cache_hits[symbol] = hits
 
-        # Step 2: Bulk fetch only missing tokens (1 API CALL for all!)
-        if cache_misses:
-            base_prices = self.coingecko.get_multiple_prices(cache_misses)
+                # Cache misses - only these DEX variants need generating
+                if len(hits) < len(dex_keys):
+                    miss_dexes[symbol] = [dex_key for dex_key in dex_keys if dex_key not in hits]
 
-            # Step 3: Generate DEX variations for all fetched tokens
-            for symbol, base_data in base_prices.items():
-                if symbol not in cache_hits:
-                    cache_hits[symbol] = {}
+            # Variants can be rebuilt from cached base data without HTTP
+            for symbol in miss_dexes:
+                base_data = self.base_cache.get(symbol)
+                if base_data is not None:
+                    base_prices[symbol] = base_data
+                else:
+                    cache_misses.add(symbol)
 
-                for dex_key in dex_keys:
-                    # Generate DEX-specific price
-                    dex_price_data = self._generate_dex_price(base_data, dex_key)
+        # Step 2: Bulk fetch only tokens without base data (1 API CALL for all!)
+        if cache_misses:
+            fetched = self.coingecko.get_multiple_prices(list(cache_misses))
+            with self._cache_lock:
+                for symbol, base_data in fetched.items():
+                    self.base_cache.set(symbol, base_data)
+                base_prices.update(fetched)
+
+                # An empty result means the request itself failed; only remember
+                # symbols missing from a successful response
+                if fetched:
+                    for symbol in cache_misses.difference(fetched):
+                        self.negative_cache.set(symbol, True)
+
+        # Step 3: Generate the missing DEX variations for all tokens in one step
+        pairs = [
+            (symbol, dex_key)
+            for symbol in base_prices
+            for dex_key in miss_dexes.get(symbol, ())
+        ]
+        if pairs:
+            with self._cache_lock:
+                # Reuse variants simulated for the same base price so unchanged
+                # markets keep stable DEX prices between refreshes
+                variant_keys = [
+                    (symbol, dex_key, base_prices[symbol]["price_usd"])
+                    for symbol, dex_key in pairs
+                ]
+                dex_prices = [self.variant_cache.get(key) for key in variant_keys]
+                stale = [i for i, price in enumerate(dex_prices) if price is None]
+
+                if stale:
+                    simulated = self._simulate_dex_prices([variant_keys[i][2] for i in stale]).tolist()
+                    for i, price in zip(stale, simulated):
+                        dex_prices[i] = price
+                        self.variant_cache.set(variant_keys[i], price)
+
+                # Fields shared by all DEXes are built once per token
+                shared = {symbol: self._shared_dex_fields(base_prices[symbol]) for symbol, _ in pairs}
+                source_labels = self._source_labels
+
+                for (symbol, dex_key), dex_price in zip(pairs, dex_prices):
+                    # Build DEX-specific price data
+                    dex_price_data = PricePacket(
+                        dex_price,
+                        *shared[symbol],
+                        source_labels.get(dex_key) or f"{dex_key}_simulated"
+                    )
 
                     # Cache it
-                    cache_key = self.price_cache.make_key(symbol, dex_key)
-                    self.price_cache.set(cache_key, dex_price_data)
+                    self.price_cache.set((symbol, dex_key), dex_price_data)
 
                     # Add to results
                     cache_hits[symbol][dex_key] = dex_price_data
@@ -211,23 +273,35 @@ class DataService:
         Returns:
             Volatility category: "Low", "Medium", "High", "Very High"
         """
-        abs_change = abs(price_change_24h)
+        return _VOLATILITY_LABELS[bisect.bisect_right(_VOLATILITY_THRESHOLDS, abs(price_change_24h))]
+
+    def calculate_volatility_bulk(self, price_changes_24h) -> List[str]:
+        """
+        Calculate volatility categories for many 24h price changes at once
+
+        Args:
+            price_changes_24h: Sequence or array of price change percentages
 
-        if abs_change < 2:
-            return "Low"
-        elif abs_change < 5:
-            return "Medium"
-        elif abs_change < 10:
-            return "High"
-        else:
-            return "Very High"
+        Returns:
+            List of volatility categories, same order as the input
+        """
+        bins = np.digitize(np.abs(np.asarray(price_changes_24h, dtype=np.float64)), _VOLATILITY_THRESHOLDS)
+        return [_VOLATILITY_LABELS[i] for i in bins.tolist()]
 
     def clear_cache(self) -> None:
         """Clear all caches"""
-        self.price_cache.clear()
+        with self._cache_lock:
+            self.price_cache.clear()
+            self.base_cache.clear()
+            self.negative_cache.clear()
+            self.variant_cache.clear()
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
-        return {
-            "price_cache_size": len(self.price_cache.cache)
-        }
+        with self._cache_lock:
+            return {
+                "price_cache_size": len(self.price_cache.cache),
+                "base_cache_size": len(self.base_cache.cache),
+                "negative_cache_size": len(self.negative_cache.cache),
+                "variant_cache_size": len(self.variant_cache.cache)
+            }
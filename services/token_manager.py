@@ -117,5 +117,4 @@ class TokenManager:
 
     def is_token_tracked(self, token_id: int) -> bool:
         """Check if token is tracked"""
-        tracked = self.get_tracked_tokens()
-        return any(token.id == token_id for token, _ in tracked)
+        return self.db_manager.is_tracked(token_id)
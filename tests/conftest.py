@@ -0,0 +1,76 @@
+"""
+Shared pytest fixtures for DEX Analyzer tests
+"""
+
+from collections import defaultdict
+
+import pytest
+from filelock import FileLock
+from PySide6.QtCore import QObject
+
+from config import Config
+from database.migration_manager import MigrationManager
+from database.database_manager import DatabaseManager
+
+
+@pytest.fixture(scope="session")
+def migrated_db(tmp_path_factory, worker_id):
+    """
+    Database migrated once per test run, shared by every test in a worker
+
+    Tests use a temporary database file, never the app's Config.DATABASE_NAME.
+    Under pytest-xdist the first worker to take the lock runs the migrations;
+    the others wait for it and then open the already-migrated database.
+    WAL mode (persisted in the file) lets the workers read while another one
+    writes; it is only ever set on the temporary test database.
+    """
+    if worker_id == "master":
+        # Not running under xdist
+        db = DatabaseManager(str(tmp_path_factory.mktemp("db") / "integration.db"))
+        MigrationManager(db).run_migrations()
+    else:
+        # Directory shared by all workers of this run
+        shared_tmp = tmp_path_factory.getbasetemp().parent
+        with FileLock(str(shared_tmp / "migration.lock")):
+            db_path = str(shared_tmp / "integration.db")
+            assert db_path != Config.DATABASE_NAME
+            db = DatabaseManager(db_path)
+            db.conn.execute("PRAGMA journal_mode=WAL")
+            done = shared_tmp / "migrated"
+            if not done.exists():
+                MigrationManager(db).run_migrations()
+                done.touch()
+
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def main_window(qapp, migrated_db):
+    """Main window shared by all tests in a worker, with at least one tracked token"""
+    from gui.main_window import MainWindow
+
+    qapp.setStyle('Fusion')
+
+    # The Tracked Tokens checks need a row; seed one and remove it afterwards
+    seeded_token_id = None
+    if not migrated_db.get_tracked_tokens():
+        seeded_token_id = migrated_db.get_all_tokens()[0].id
+        migrated_db.add_tracked_token(seeded_token_id, Config.DEFAULT_THRESHOLD, 'percentage')
+
+    window = MainWindow(db_manager=migrated_db)
+    window.show()
+    yield window
+
+    window.close()
+    if seeded_token_id is not None:
+        migrated_db.remove_tracked_token(seeded_token_id)
+
+
+@pytest.fixture(scope="session")
+def child_index(main_window):
+    """Main window children grouped by exact type, collected with one tree walk"""
+    index = defaultdict(list)
+    for child in main_window.findChildren(QObject):
+        index[type(child)].append(child)
+    return index
@@ -0,0 +1,50 @@
+"""
+Tests for the Current Prices table refresh flow with a stub data service
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from PySide6.QtWidgets import QMessageBox
+
+from gui.widgets.current_prices_table import CurrentPricesTable
+
+TRACKED = [
+    (SimpleNamespace(symbol="BTC", name="Bitcoin"), None),
+    (SimpleNamespace(symbol="ETH", name="Ethereum"), None),
+]
+
+
+class StubTokenManager:
+    def get_tracked_tokens(self):
+        return TRACKED
+
+
+class EmptyDataService:
+    """Provider failed or every symbol is negative-cached: no DEX prices"""
+
+    def get_bulk_prices_all_dexes(self, token_symbols, dex_keys=None):
+        return {symbol: {} for symbol in token_symbols}
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    """Record QMessageBox.warning calls instead of opening a dialog"""
+    calls = []
+    monkeypatch.setattr(QMessageBox, "warning", lambda *args: calls.append(args))
+    return calls
+
+
+def test_refresh_without_prices_warns(qtbot, warnings):
+    """Tokens with no DEX prices are dropped and the warning path is taken"""
+    table = CurrentPricesTable(StubTokenManager(), EmptyDataService(), theme_manager=None)
+    qtbot.addWidget(table)
+
+    table.refresh_prices()
+    qtbot.waitUntil(table.refresh_btn.isEnabled, timeout=2000)
+    table.fetcher_thread.wait()
+
+    assert table.prices_cache == {}
+    assert table.model.rowCount() == 0
+    assert table.status_label.text() == "No prices fetched"
+    assert warnings
@@ -0,0 +1,175 @@
+"""
+Tests for DataService bulk price fetching with a stub CoinGecko provider
+"""
+
+import pytest
+from cachetools import TTLCache
+
+from config import Config
+from services.data_service import DataService
+
+BASE_DATA = {
+    "BTC": {"price_usd": 60000.0, "volume_24h": 1e9, "price_change_24h": 1.5,
+            "market_cap": 1e12, "last_updated": "2024-01-01T00:00:00Z"},
+    "ETH": {"price_usd": 3000.0, "volume_24h": 5e8, "price_change_24h": -2.0,
+            "market_cap": 4e11, "last_updated": "2024-01-01T00:00:00Z"},
+}
+
+
+class StubProvider:
+    """Records bulk requests and answers from BASE_DATA"""
+
+    def __init__(self, service, fail=False):
+        self.service = service
+        self.fail = fail
+        self.calls = []
+
+    def get_multiple_prices(self, symbols):
+        # The cache lock must not be held across HTTP
+        assert not self.service._cache_lock.locked()
+        self.calls.append(sorted(symbols))
+        if self.fail:
+            return {}
+        return {symbol: BASE_DATA[symbol] for symbol in symbols if symbol in BASE_DATA}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def service():
+    service = DataService()
+    service.coingecko = StubProvider(service)
+    return service
+
+
+def test_bulk_fetch_uses_one_request(service):
+    """All symbols and DEXes come from a single provider call"""
+    prices = service.get_bulk_prices_all_dexes(["BTC", "ETH"])
+
+    assert service.coingecko.calls == [["BTC", "ETH"]]
+    for symbol in ("BTC", "ETH"):
+        assert set(prices[symbol]) == set(Config.DEX_KEYS)
+        packet = prices[symbol][Config.DEX_KEYS[0]]
+        assert packet.volume_24h == BASE_DATA[symbol]["volume_24h"]
+        assert packet.source == f"{Config.DEX_KEYS[0]}_simulated"
+
+
+def test_cached_prices_skip_http(service):
+    """A second fetch within the TTL is answered from the price cache"""
+    first = service.get_bulk_prices_all_dexes(["BTC"])
+    second = service.get_bulk_prices_all_dexes(["BTC"])
+
+    assert len(service.coingecko.calls) == 1
+    assert second == first
+
+
+def test_cached_base_data_skips_http(service):
+    """Expired DEX prices are rebuilt from cached base data without HTTP"""
+    first = service.get_bulk_prices_all_dexes(["BTC"])
+    service.price_cache.clear()
+
+    second = service.get_bulk_prices_all_dexes(["BTC"])
+
+    assert len(service.coingecko.calls) == 1
+    # Same base price, so the cached variants are reused
+    assert second == first
+
+
+def test_only_missing_variants_are_simulated(service, monkeypatch):
+    """Adding DEXes simulates prices for the new ones only"""
+    uniswap, *others = Config.DEX_KEYS
+    first = service.get_bulk_prices_all_dexes(["BTC"], [uniswap])
+
+    simulated = []
+    simulate = service._simulate_dex_prices
+    monkeypatch.setattr(service, "_simulate_dex_prices",
+                        lambda base: simulated.append(list(base)) or simulate(base))
+
+    second = service.get_bulk_prices_all_dexes(["BTC"], Config.DEX_KEYS)
+
+    assert len(service.coingecko.calls) == 1
+    assert simulated == [[BASE_DATA["BTC"]["price_usd"]] * len(others)]
+    assert second["BTC"][uniswap] is first["BTC"][uniswap]
+    assert set(second["BTC"]) == set(Config.DEX_KEYS)
+
+
+def test_new_base_price_gets_new_variants(service):
+    """Variants are keyed by base price, so a price move re-simulates them"""
+    dex_key = Config.DEX_KEYS[0]
+    service.get_bulk_prices_all_dexes(["BTC"], [dex_key])
+    # Keep the variant cache; only the base data moves
+    service.price_cache.clear()
+    service.base_cache.clear()
+
+    moved = dict(BASE_DATA["BTC"], price_usd=70000.0)
+    service.coingecko.get_multiple_prices = lambda symbols: {"BTC": moved}
+
+    price = service.get_bulk_prices_all_dexes(["BTC"], [dex_key])["BTC"][dex_key].price_usd
+    assert 70000.0 * 0.999 <= price <= 70000.0 * 1.02
+    assert len(service.variant_cache) == 2
+
+
+def test_missing_symbols_are_negative_cached(service):
+    """Symbols absent from a successful response are skipped until the TTL ends"""
+    clock = FakeClock()
+    service.negative_cache.cache = TTLCache(maxsize=500, ttl=Config.NEGATIVE_CACHE_TTL, timer=clock)
+
+    prices = service.get_bulk_prices_all_dexes(["BTC", "NOPE"])
+    assert prices["NOPE"] == {}
+    assert service.coingecko.calls == [["BTC", "NOPE"]]
+
+    # Within the TTL the unknown symbol is not requested again
+    clock.now = Config.NEGATIVE_CACHE_TTL - 1
+    assert service.get_bulk_prices_all_dexes(["NOPE"]) == {"NOPE": {}}
+    assert len(service.coingecko.calls) == 1
+
+    # Once it expires the symbol is retried
+    clock.now = Config.NEGATIVE_CACHE_TTL + 1
+    service.get_bulk_prices_all_dexes(["NOPE"])
+    assert service.coingecko.calls[-1] == ["NOPE"]
+
+
+def test_failed_request_is_not_negative_cached(service):
+    """An empty response means the request failed, so nothing is remembered"""
+    service.coingecko.fail = True
+
+    assert service.get_bulk_prices_all_dexes(["BTC"]) == {"BTC": {}}
+    assert len(service.negative_cache) == 0
+
+    service.coingecko.fail = False
+    assert service.get_bulk_prices_all_dexes(["BTC"])["BTC"]
+    assert len(service.coingecko.calls) == 2
+
+
+def test_clear_cache_resets_negative_cache(service):
+    """clear_cache lets negative-cached symbols be requested again"""
+    service.get_bulk_prices_all_dexes(["BTC", "NOPE"])
+    assert service.get_cache_stats()["negative_cache_size"] == 1
+
+    service.clear_cache()
+
+    assert service.get_cache_stats() == {
+        "price_cache_size": 0,
+        "base_cache_size": 0,
+        "negative_cache_size": 0,
+        "variant_cache_size": 0,
+    }
+    service.get_bulk_prices_all_dexes(["NOPE"])
+    assert service.coingecko.calls[-1] == ["NOPE"]
+
+
+def test_single_token_helpers_use_bulk_path(service):
+    """get_token_price and get_all_dex_prices share the bulk caches"""
+    dex_key = Config.DEX_KEYS[0]
+    all_prices = service.get_all_dex_prices("ETH")
+    packet = service.get_token_price("ETH", dex_key)
+
+    assert len(service.coingecko.calls) == 1
+    assert packet is all_prices[dex_key]
+    assert service.get_token_price("NOPE", dex_key) is None
@@ -0,0 +1,47 @@
+"""
+Tests for DatabaseManager against a temporary SQLite file
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from database.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database in a temp directory, never the app database"""
+    manager = DatabaseManager(str(tmp_path / "test.db"))
+    yield manager
+    manager.close()
+
+
+def test_insert_arbitrage_opportunities_bulk_round_trip(db):
+    """A bulk-inserted batch is read back as the latest opportunities"""
+    btc_id = db.insert_token("BTC", "Bitcoin")
+    eth_id = db.insert_token("ETH", "Ethereum")
+
+    # Older single insert must not show up in the latest batch
+    db.insert_arbitrage_opportunity(btc_id, "Uniswap V3", 1.0, "PancakeSwap V3", 2.0,
+                                    100.0, 1.0, timestamp=datetime.now() - timedelta(hours=1))
+
+    rows = [
+        (btc_id, "Uniswap V3", 60000.0, "PancakeSwap V3", 60300.0, 0.5, 300.0),
+        (eth_id, "PancakeSwap V3", 3000.0, "Uniswap V3", 3036.0, 1.2, 36.0),
+    ]
+    assert db.insert_arbitrage_opportunities_bulk(rows) == 2
+
+    latest = db.get_latest_arbitrage_opportunities()
+    assert [row[:7] for row in latest] == [
+        ("ETH", "PancakeSwap V3", 3000.0, "Uniswap V3", 3036.0, 1.2, 36.0),
+        ("BTC", "Uniswap V3", 60000.0, "PancakeSwap V3", 60300.0, 0.5, 300.0),
+    ]
+    # Whole batch shares one timestamp
+    assert len({row[7] for row in latest}) == 1
+
+
+def test_insert_arbitrage_opportunities_bulk_empty(db):
+    """An empty batch inserts nothing"""
+    assert db.insert_arbitrage_opportunities_bulk([]) == 0
+    assert db.get_latest_arbitrage_opportunities() == []
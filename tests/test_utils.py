@@ -0,0 +1,121 @@
+"""
+Tests for utils: batch price formatting, the cached decorator and the rate limiter
+"""
+
+import math
+import time
+
+import pytest
+
+from utils import RateLimiter, cached, format_price, format_prices
+
+# Bucket edges of format_price plus values on either side of them
+EDGE_PRICES = [
+    0.0, -0.0, -1.0, -1e-9, math.nan, math.inf,
+    1e-9, 1e-7, 0.000123, 0.0001, 0.00100000, 0.0099999, 0.00999999,
+    0.01, 0.0100001, 0.5, 0.99999, 0.999999,
+    1.0, 1.0001, 99.9994, 99.9996, 99.999999,
+    100.0, 100.004, 1234.5, 50000.0, 1e12,
+]
+
+
+@pytest.mark.parametrize("price", EDGE_PRICES)
+def test_format_prices_matches_format_price(price):
+    """format_prices gives the same text as format_price for each edge value"""
+    assert format_prices([price]) == [format_price(price)]
+
+
+def test_format_prices_batch_keeps_order():
+    """A mixed batch is formatted element by element, in input order"""
+    assert format_prices(EDGE_PRICES) == [format_price(p) for p in EDGE_PRICES]
+
+
+def test_format_prices_strips_trailing_zeros_for_tiny_prices():
+    """Prices below $0.01 drop trailing zeros"""
+    assert format_prices([0.0001, 0.00100000]) == ["$0.0001", "$0.001"]
+
+
+def test_format_prices_empty():
+    """An empty input gives an empty list"""
+    assert format_prices([]) == []
+
+
+def make_counted(ttl=30):
+    """Cached function that records each real call"""
+    calls = []
+
+    @cached(ttl=ttl)
+    def pair(a, b=0):
+        calls.append((a, b))
+        return a, b
+
+    return pair, calls
+
+
+def test_cached_hits_and_misses():
+    """Repeated arguments hit the cache; new arguments call through"""
+    pair, calls = make_counted()
+
+    assert pair(1, 2) == (1, 2)
+    assert pair(1, 2) == (1, 2)
+    assert pair(2, 2) == (2, 2)
+    assert calls == [(1, 2), (2, 2)]
+
+
+def test_cached_keeps_keyword_arguments_apart():
+    """Keyword and positional calls get separate keys"""
+    pair, calls = make_counted()
+
+    pair(1, 2)
+    pair(1, b=2)
+    pair(1, ("b", 2))
+    pair(1, b=2)
+    assert len(calls) == 3
+
+
+def test_cached_entries_expire():
+    """Entries are recomputed after the TTL"""
+    pair, calls = make_counted(ttl=0.05)
+
+    pair(1)
+    pair(1)
+    time.sleep(0.1)
+    pair(1)
+    assert len(calls) == 2
+
+
+def test_rate_limiter_paces_requests():
+    """After the burst, requests are spaced 1 / rate seconds apart"""
+    limiter = RateLimiter(rate=20, burst=1)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    # First request uses the burst token, the other 4 wait 0.05s each
+    assert 0.18 <= elapsed < 0.5, f"Elapsed: {elapsed:.3f}s"
+
+
+def test_rate_limiter_allows_burst():
+    """Up to `burst` requests go through without waiting"""
+    limiter = RateLimiter(rate=1, burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.05, f"Elapsed: {elapsed:.3f}s"
+
+
+def test_rate_limiter_defer_blocks_next_request():
+    """defer() holds back the next request even when tokens are available"""
+    limiter = RateLimiter(rate=100, burst=5)
+    limiter.defer(0.2)
+
+    start = time.monotonic()
+    limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert 0.18 <= elapsed < 0.5, f"Elapsed: {elapsed:.3f}s"
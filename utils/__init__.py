@@ -1,5 +1,7 @@
 """Utility functions and classes"""
 
-from .cache import SimpleCache, format_price
+from .cache import SimpleCache, cached, format_price, format_prices
+from .rate_limiter import RateLimiter
+from .logging_setup import setup_logging
 
-__all__ = ['SimpleCache', 'format_price']
+__all__ = ['SimpleCache', 'cached', 'format_price', 'format_prices', 'RateLimiter', 'setup_logging']
@@ -1,7 +1,8 @@
-from cachetools import TTLCache
-from typing import Any, Optional
-import hashlib
-import json
+import threading
+import numpy as np
+from cachetools import TTLCache, cached as _cached
+from cachetools.keys import hashkey
+from typing import Any, Callable, Hashable, List, Optional
 
 
 def format_price(price: float) -> str:
@@ -38,8 +39,47 @@ def format_price(price: float) -> str:
         return f"${price:,.2f}"
 
 
+# format_price templates for the price buckets above $0.00, smallest first
+_PRICE_FORMATS = ("${:.6f}".format, "${:.4f}".format, "${:.3f}".format, "${:,.2f}".format)
+
+
+def format_prices(prices) -> List[str]:
+    """
+    Format many prices at once, with the same output as format_price.
+
+    Args:
+        prices: Sequence or array of price values
+
+    Returns:
+        List of formatted price strings, same order as the input
+    """
+    arr = np.asarray(prices, dtype=np.float64).ravel()
+    buckets = np.select([arr <= 0, arr < 0.01, arr < 1, arr < 100], [0, 1, 2, 3], default=4)
+
+    values = arr.tolist()
+    result = ["$0.00"] * len(values)
+
+    for bucket, fmt in enumerate(_PRICE_FORMATS, start=1):
+        for i in np.flatnonzero(buckets == bucket).tolist():
+            result[i] = fmt(values[i])
+
+    # Very small prices drop trailing zeros
+    for i in np.flatnonzero(buckets == 1).tolist():
+        result[i] = result[i].rstrip('0').rstrip('.')
+
+    return result
+
+
+# Separates positional from keyword arguments in make_key tuples
+_KWARGS_MARK = object()
+
+
 class SimpleCache:
-    """Simple TTL cache wrapper"""
+    """Simple TTL cache wrapper
+
+    Keys may be any hashable value, such as (symbol, dex_key) tuples or
+    the keys produced by make_key.
+    """
 
     def __init__(self, maxsize: int = 1000, ttl: int = 30):
         """
@@ -51,15 +91,15 @@ class SimpleCache:
         """
         self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
 
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get item from cache"""
         return self.cache.get(key)
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """Set item in cache"""
         self.cache[key] = value
 
-    def delete(self, key: str) -> None:
+    def delete(self, key: Hashable) -> None:
         """Delete item from cache"""
         if key in self.cache:
             del self.cache[key]
@@ -68,7 +108,7 @@ class SimpleCache:
         """Clear entire cache"""
         self.cache.clear()
 
-    def make_key(self, *args, **kwargs) -> str:
+    def make_key(self, *args, **kwargs) -> tuple:
         """
         Create cache key from arguments
 
@@ -77,22 +117,34 @@ class SimpleCache:
             **kwargs: Keyword arguments
 
         Returns:
-            Hashed cache key
+            Hashable tuple key; the dict lookup hashes it, no digest is computed
         """
-        # Convert args and kwargs to string
-        key_data = {
-            'args': args,
-            'kwargs': kwargs
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
+        if not kwargs:
+            return args
+        # The marker keeps f(a, (k, v)) and f(a, k=v) from sharing a key
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
 
-        # Hash for shorter key
-        return hashlib.md5(key_str.encode()).hexdigest()
-
-    def __contains__(self, key: str) -> bool:
+    def __contains__(self, key: Hashable) -> bool:
         """Check if key exists in cache"""
         return key in self.cache
 
     def __len__(self) -> int:
         """Get cache size"""
         return len(self.cache)
+
+
+def cached(ttl: int = 30, maxsize: int = 1000) -> Callable:
+    """
+    Memoize a function in a thread-safe TTL cache keyed by its arguments
+
+    Arguments are hashed as a tuple directly, so callers do not build keys
+    with SimpleCache.make_key.
+
+    Args:
+        ttl: Time to live in seconds
+        maxsize: Maximum number of cached results
+
+    Returns:
+        Decorator for the function to cache
+    """
+    return _cached(TTLCache(maxsize=maxsize, ttl=ttl), key=hashkey, lock=threading.RLock())
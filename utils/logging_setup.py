@@ -0,0 +1,33 @@
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route all log records through a queue to a background stderr writer
+
+    Worker threads only enqueue records; formatting and writes happen on
+    the listener thread, so logging never blocks a fetch.
+
+    Args:
+        level: Minimum level for the root logger
+
+    Returns:
+        Started QueueListener; call stop() on shutdown to flush pending records
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,48 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket rate limiter"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate: Requests allowed per second (bucket refill rate)
+            burst: Maximum number of requests allowed back to back
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be made"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+
+            time.sleep(wait)
+
+    def defer(self, seconds: float) -> None:
+        """
+        Hold back all requests for a period (e.g. after HTTP 429)
+
+        Args:
+            seconds: Time to wait before the next request is allowed
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0